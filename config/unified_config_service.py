@@ -11,13 +11,14 @@ import os
 import base64
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Union
 from abc import ABC, abstractmethod
 
 from .config_validator import ConfigValidator
 from .exceptions import ConfigFileNotFoundError, ConfigParseError, ConfigValidationError
 from .trading_mode import TradingMode
 from strategies.strategy_type import StrategyType
+from utils.file_utils import atomic_write_json
 from core.error_handling import (
     ErrorContext, ErrorCategory, ErrorSeverity,
     ConfigurationError, error_handler
@@ -79,8 +80,7 @@ class FileConfigurationAdapter(ConfigurationAdapter):
                 "config": config
             }
             
-            with open(destination, 'w', encoding='utf-8') as f:
-                json.dump(config_with_metadata, f, indent=2, ensure_ascii=False)
+            atomic_write_json(config_with_metadata, destination)
             
             return True
             
@@ -211,8 +211,9 @@ class UnifiedConfigurationService:
             self.validator.validate(config)
             
             # Generate filename if not provided
+            now = datetime.now()
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"grid_config_export_{timestamp}.json"
             
             # Ensure .json extension
@@ -222,10 +223,10 @@ class UnifiedConfigurationService:
             # Create export data with metadata
             export_data = {
                 "metadata": {
-                    "exported_at": datetime.now().isoformat(),
+                    "exported_at": now.isoformat(),
                     "exported_by": "Grid Trading Bot Unified Config Service",
                     "version": "2.0",
-                    "description": f"Exported grid trading configuration on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                    "description": f"Exported grid trading configuration on {now.strftime('%Y-%m-%d %H:%M:%S')}"
                 },
                 "config": config
             }
@@ -246,12 +247,12 @@ class UnifiedConfigurationService:
             self.logger.error(error_msg, exc_info=True)
             return False, "", error_msg
     
-    def import_configuration(self, file_content: str) -> Tuple[bool, Dict[str, Any], str]:
+    def import_configuration(self, file_content: Union[str, bytes]) -> Tuple[bool, Dict[str, Any], str]:
         """
         Import configuration from uploaded file content.
         
         Args:
-            file_content: JSON string content of uploaded file
+            file_content: JSON content of uploaded file, as text or raw UTF-8 bytes
             
         Returns:
             Tuple of (success, config_dict, message)
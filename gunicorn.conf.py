@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for serving the Grid Trading Bot Web UI.
+
+Usage:
+    gunicorn -c gunicorn.conf.py
+
+Threaded workers let the blocking exchange calls made by the price callbacks
+yield to other requests instead of stalling every connected user.
+"""
+
+import os
+
+wsgi_app = "web_ui.app:create_server()"
+bind = os.getenv("WEB_UI_BIND", "0.0.0.0:8050")
+workers = int(os.getenv("WEB_UI_WORKERS", "4"))
+worker_class = "gthread"
+threads = int(os.getenv("WEB_UI_THREADS", "4"))
+timeout = 60
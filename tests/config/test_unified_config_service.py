@@ -0,0 +1,28 @@
+import json
+import pytest
+from config.unified_config_service import FileConfigurationAdapter
+
+class TestFileConfigurationAdapter:
+    @pytest.fixture
+    def adapter(self):
+        return FileConfigurationAdapter()
+
+    def test_save_config_writes_config_with_metadata(self, adapter, tmp_path, valid_config):
+        destination = tmp_path / "config.json"
+
+        assert adapter.save_config(valid_config, str(destination))
+
+        saved = json.loads(destination.read_text(encoding="utf-8"))
+        assert saved["config"] == valid_config
+        assert "created_at" in saved["metadata"]
+        assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
+
+    def test_save_config_failure_keeps_previous_file(self, adapter, tmp_path, valid_config):
+        destination = tmp_path / "config.json"
+        adapter.save_config(valid_config, str(destination))
+        previous = destination.read_text(encoding="utf-8")
+
+        assert not adapter.save_config({"unserializable": object()}, str(destination))
+
+        assert destination.read_text(encoding="utf-8") == previous
+        assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
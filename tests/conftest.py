@@ -1,5 +1,25 @@
 import pytest
 
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked slow_ui (component trees, figures, large-dataset benchmarks) for quicker local iterations"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--fast"):
+        return
+
+    skip_slow_ui = pytest.mark.skip(reason="skipped with --fast")
+    for item in items:
+        if "slow_ui" in item.keywords:
+            item.add_marker(skip_slow_ui)
+
+
 @pytest.fixture
 def valid_config():
     """Fixture providing a valid configuration for testing."""
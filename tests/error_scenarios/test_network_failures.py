@@ -8,6 +8,7 @@ and other network-related error scenarios.
 import pytest
 import asyncio
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import aiohttp
@@ -22,7 +23,7 @@ from core.services.live_exchange_service import LiveExchangeService
 from core.services.backtest_exchange_service import BacktestExchangeService
 from core.services.exceptions import DataFetchError, OrderCancellationError
 from config.config_manager import ConfigManager
-from web_ui.price_service import price_service
+from web_ui.price_service import PriceFeed, price_service
 from core.error_handling import NetworkError as UnifiedNetworkError, error_handler
 
 
@@ -407,5 +408,72 @@ class TestNetworkRecoveryMechanisms:
         assert successful_connections + failed_connections == 10
 
 
+
+class TestPriceFeedLimits:
+    """Test that the websocket price feed gives up on failing and excess symbols."""
+    
+    KEY = "fakex_BTC/USD"
+    
+    def _subscribed_feed(self, watch_ticker, **kwargs):
+        """Build a feed with one registered subscription on a fake ccxt.pro exchange."""
+        feed = PriceFeed(retry_delay=0.001, **kwargs)
+        exchange = Mock(watch_ticker=watch_ticker, close=AsyncMock())
+        feed._ccxtpro = Mock(fakex=Mock(return_value=exchange))
+        feed._loop = Mock()
+        feed._last_read[self.KEY] = time.monotonic()
+        return feed, exchange
+    
+    async def test_failing_stream_is_dropped_with_backoff(self):
+        """Repeated errors back off exponentially, then drop the symbol and cool it down."""
+        feed, exchange = self._subscribed_feed(AsyncMock(side_effect=NetworkError("unreachable")),
+                                               max_failures=4)
+        
+        with patch("web_ui.price_service.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await feed._run_ws_loop("fakex", "BTC/USD", self.KEY)
+        
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.001, 0.002, 0.004]
+        assert self.KEY not in feed._last_read
+        exchange.close.assert_awaited_once()
+        assert feed.subscribe("fakex", "BTC/USD") is False
+    
+    async def test_idle_stream_is_dropped(self):
+        """A stream whose price is no longer read stops after idle_timeout."""
+        feed, exchange = self._subscribed_feed(AsyncMock(return_value={"last": 95000.0}), idle_timeout=60.0)
+        feed._last_read[self.KEY] -= 120.0
+        
+        await feed._run_ws_loop("fakex", "BTC/USD", self.KEY)
+        
+        exchange.watch_ticker.assert_not_awaited()
+        assert self.KEY not in feed._last_read
+        assert self.KEY not in feed._retry_after
+    
+    def test_subscriptions_are_capped(self):
+        """No new streams are started once max_subscriptions symbols are streamed."""
+        feed = PriceFeed(max_subscriptions=2)
+        feed._loop = Mock()
+        
+        with patch("web_ui.price_service.asyncio.run_coroutine_threadsafe") as mock_schedule:
+            results = [feed.subscribe("fakex", symbol) for symbol in ("BTC/USD", "ETH/USD", "SOL/USD")]
+        
+        assert results == [True, True, False]
+        assert mock_schedule.call_count == 2
+        for call in mock_schedule.call_args_list:
+            call.args[0].close()
+    
+    def test_new_subscription_serves_fallback_price_immediately(self):
+        """A price request for a new symbol does not wait on the stream's first tick."""
+        price_feed = price_service.price_feed
+        
+        with patch.object(price_feed, "_loop", Mock()), \
+             patch.dict(price_feed._last_read), \
+             patch("web_ui.price_service.asyncio.run_coroutine_threadsafe") as mock_schedule:
+            start = time.monotonic()
+            price = price_service.get_current_price_sync("fakex", "BTC", "USD")
+            elapsed = time.monotonic() - start
+        
+        mock_schedule.call_args.args[0].close()
+        assert price is not None
+        assert elapsed < 0.5
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
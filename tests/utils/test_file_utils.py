@@ -0,0 +1,41 @@
+import json
+import os
+import stat
+import pytest
+from utils.file_utils import atomic_write_json
+
+def test_atomic_write_json_writes_data(tmp_path):
+    destination = tmp_path / "config.json"
+
+    atomic_write_json({"name": "grid"}, destination)
+
+    assert json.loads(destination.read_text(encoding="utf-8")) == {"name": "grid"}
+    assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
+
+def test_atomic_write_json_keeps_existing_permissions(tmp_path):
+    destination = tmp_path / "config.json"
+    destination.write_text("{}", encoding="utf-8")
+    os.chmod(destination, 0o664)
+
+    atomic_write_json({"name": "grid"}, destination)
+
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o664
+
+def test_atomic_write_json_new_file_gets_default_permissions(tmp_path):
+    destination = tmp_path / "config.json"
+    reference = tmp_path / "reference.json"
+    reference.write_text("{}", encoding="utf-8")
+
+    atomic_write_json({"name": "grid"}, destination)
+
+    assert stat.S_IMODE(destination.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+
+def test_atomic_write_json_failure_keeps_previous_file(tmp_path):
+    destination = tmp_path / "config.json"
+    destination.write_text('{"name": "grid"}', encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        atomic_write_json({"unserializable": object()}, destination)
+
+    assert destination.read_text(encoding="utf-8") == '{"name": "grid"}'
+    assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
@@ -12,11 +12,13 @@ Comprehensive test runner for all UI-related tests including:
 import sys
 import os
 import time
-import subprocess
+import asyncio
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
 
+import orjson
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
@@ -27,6 +29,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Invariant prefix of the pytest command used for every suite
+_PYTEST_BASE_CMD = (sys.executable, '-m', 'pytest', '-v', '--tb=short', '--disable-warnings')
+
+# Summary tokens matched against raw (undecoded) pytest output
+_SUMMARY_TOKENS = {b'passed': 'passed', b'failed': 'failed', b'skipped': 'skipped'}
+
 
 class UITestRunner:
     """Comprehensive UI test runner with reporting and analysis."""
@@ -35,6 +43,7 @@ class UITestRunner:
         """Initialize the test runner."""
         self.test_dir = Path(__file__).parent
         self.project_root = self.test_dir.parent.parent
+        self._project_root_str = str(self.project_root)
         self.test_results = {}
         self.total_tests = 0
         self.passed_tests = 0
@@ -70,11 +79,30 @@ class UITestRunner:
             }
         ]
         
-        # Run each test suite
+        # Discover the available test files once and skip missing suites up front
+        existing_files = {
+            entry.name for entry in os.scandir(self.test_dir)
+            if entry.name.startswith('test_') and entry.name.endswith('.py')
+        }
+        
         for suite in test_suites:
-            logger.info(f"Running {suite['name']}...")
-            result = self._run_test_suite(suite)
-            self.test_results[suite['name']] = result
+            if suite['file'] not in existing_files:
+                logger.warning(f"Test file not found: {suite['file']}")
+                self.test_results[suite['name']] = {
+                    'status': 'skipped',
+                    'reason': 'Test file not found',
+                    'tests': 0,
+                    'passed': 0,
+                    'failed': 0,
+                    'skipped': 0,
+                    'duration': 0,
+                    'output': ''
+                }
+        
+        test_suites = [suite for suite in test_suites if suite['file'] in existing_files]
+        
+        # Run the test suites concurrently
+        asyncio.run(self._run_all_async(test_suites))
         
         # Calculate overall statistics
         total_time = time.time() - start_time
@@ -112,10 +140,25 @@ class UITestRunner:
             'description': f'Specific test: {test_name}'
         }
         
-        result = self._run_test_suite(suite)
+        result = asyncio.run(self._run_test_suite_async(suite))
         return result
     
-    def _run_test_suite(self, suite: Dict[str, str]) -> Dict[str, Any]:
+    async def _run_all_async(self, test_suites: List[Dict[str, str]]):
+        """
+        Run the given test suites concurrently, each in its own pytest subprocess.
+        
+        Args:
+            test_suites: Test suite configurations
+        """
+        for suite in test_suites:
+            logger.info(f"Running {suite['name']}...")
+        
+        results = await asyncio.gather(*(self._run_test_suite_async(suite) for suite in test_suites))
+        
+        for suite, result in zip(test_suites, results):
+            self.test_results[suite['name']] = result
+    
+    async def _run_test_suite_async(self, suite: Dict[str, str]) -> Dict[str, Any]:
         """
         Run a specific test suite.
         
@@ -127,41 +170,27 @@ class UITestRunner:
         """
         test_file = self.test_dir / suite['file']
         
-        if not test_file.exists():
-            logger.warning(f"Test file not found: {suite['file']}")
-            return {
-                'status': 'skipped',
-                'reason': 'Test file not found',
-                'tests': 0,
-                'passed': 0,
-                'failed': 0,
-                'skipped': 0,
-                'duration': 0,
-                'output': ''
-            }
-        
         try:
             # Run pytest on the specific file
-            cmd = [
-                sys.executable, '-m', 'pytest',
-                str(test_file),
-                '-v',
-                '--tb=short',
-                '--disable-warnings'
-            ]
+            cmd = [*_PYTEST_BASE_CMD, str(test_file)]
             
             start_time = time.time()
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_root),
-                timeout=300  # 5 minute timeout
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._project_root_str
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)  # 5 minute timeout
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
             duration = time.time() - start_time
             
-            # Parse pytest output
-            output_lines = result.stdout.split('\n')
+            # Parse pytest output without decoding it
+            output_lines = stdout.split(b'\n')
             test_stats = self._parse_pytest_output(output_lines)
             
             # Update overall statistics
@@ -172,14 +201,14 @@ class UITestRunner:
             
             return {
                 'status': 'completed',
-                'return_code': result.returncode,
+                'return_code': process.returncode,
                 'duration': duration,
-                'output': result.stdout,
-                'errors': result.stderr,
+                'output': stdout.decode(errors='replace'),
+                'errors': stderr.decode(errors='replace'),
                 **test_stats
             }
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error(f"Test suite {suite['name']} timed out")
             return {
                 'status': 'timeout',
@@ -206,12 +235,12 @@ class UITestRunner:
                 'errors': str(e)
             }
     
-    def _parse_pytest_output(self, output_lines: List[str]) -> Dict[str, int]:
+    def _parse_pytest_output(self, output_lines: List[bytes]) -> Dict[str, int]:
         """
         Parse pytest output to extract test statistics.
         
         Args:
-            output_lines: Lines of pytest output
+            output_lines: Raw lines of pytest output
             
         Returns:
             Dictionary with test statistics
@@ -225,24 +254,15 @@ class UITestRunner:
         
         # Look for the summary line
         for line in output_lines:
-            if 'passed' in line or 'failed' in line or 'skipped' in line:
+            if any(token in line for token in _SUMMARY_TOKENS):
                 # Parse lines like "5 passed, 2 failed, 1 skipped"
                 parts = line.split()
                 for i, part in enumerate(parts):
-                    if part == 'passed' and i > 0:
-                        try:
-                            stats['passed'] = int(parts[i-1])
-                        except (ValueError, IndexError):
-                            pass
-                    elif part == 'failed' and i > 0:
-                        try:
-                            stats['failed'] = int(parts[i-1])
-                        except (ValueError, IndexError):
-                            pass
-                    elif part == 'skipped' and i > 0:
+                    key = _SUMMARY_TOKENS.get(part.rstrip(b','))
+                    if key is not None and i > 0:
                         try:
-                            stats['skipped'] = int(parts[i-1])
-                        except (ValueError, IndexError):
+                            stats[key] = int(parts[i-1])
+                        except ValueError:
                             pass
         
         stats['tests'] = stats['passed'] + stats['failed'] + stats['skipped']
@@ -396,10 +416,8 @@ def main():
             report = runner.run_all_tests()
             
             # Save report to file
-            import json
             report_file = Path(__file__).parent / 'ui_test_report.json'
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
             
             print(f"\nDetailed report saved to: {report_file}")
     
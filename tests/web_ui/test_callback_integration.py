@@ -4,20 +4,20 @@ Callback Integration Tests for Grid Trading Bot Web UI
 Tests for callback functions and their interactions with UI components.
 """
 
+import copy
+import threading
 import pytest
-import sys
-from pathlib import Path
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import json
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 import dash
 from dash import html, dcc
+from dash.exceptions import PreventUpdate
 from dash.testing.application_runners import import_app
 from dash.testing.composite import DashComposite
 import dash_bootstrap_components as dbc
@@ -26,6 +26,7 @@ from web_ui.app import GridBotUI
 from web_ui.callbacks.main_callbacks import MainCallbacks
 from web_ui.callbacks.action_callbacks import ActionCallbacks
 from web_ui.callbacks.interactive_callbacks import InteractiveCallbacks
+from web_ui.price_service import price_service
 
 
 class TestMainCallbacks:
@@ -105,15 +106,43 @@ class TestMainCallbacks:
         assert len(data) == 1
         assert 'close' in data.columns
     
+    def test_market_data_missing_from_worker_cache_is_reloaded(self):
+        """A worker that did not serve the fetch loads the frame again from the store payload."""
+        market_data = {'key': 'coinbase_BTC/USD_1h', 'exchange': 'coinbase',
+                       'base_currency': 'BTC', 'quote_currency': 'USD', 'timeframe': '1h'}
+        mock_df = pd.DataFrame({'open': [1.0], 'high': [2.0], 'low': [0.5], 'close': [1.5], 'volume': [3.0]},
+                               index=pd.date_range(start='2024-01-01', periods=1, freq='h'))
+        
+        with patch.dict(price_service.market_data_cache, clear=True), \
+             patch.object(price_service, 'get_historical_data_sync', return_value=mock_df) as mock_get_data:
+            df = price_service.get_market_data(market_data)
+            cached_df = price_service.get_market_data(market_data)
+        
+        mock_get_data.assert_called_once()
+        assert df is cached_df
+        assert df['close'].iloc[-1] == 1.5
+    
+    def test_market_data_cache_is_bounded(self):
+        """The per-process market data cache evicts the least recently used frames."""
+        cache = price_service.market_data_cache
+        
+        with patch.dict(cache, clear=True):
+            for i in range(cache.maxsize + 5):
+                cache[f"key_{i}"] = pd.DataFrame()
+            
+            assert len(cache) == cache.maxsize
+            assert "key_0" not in cache
+            assert f"key_{cache.maxsize + 4}" in cache
+    
     def test_config_update_validation(self):
         """Test configuration update validation."""
         # Test valid configuration
-        valid_config = self.sample_config.copy()
+        valid_config = self.sample_config
         assert valid_config["exchange"]["name"] == "coinbase"
         assert valid_config["pair"]["base_currency"] == "BTC"
         
-        # Test invalid configuration
-        invalid_config = valid_config.copy()
+        # Test invalid configuration (deep copy so the nested grid dict is not shared)
+        invalid_config = copy.deepcopy(valid_config)
         invalid_config["grid_strategy"]["bottom_price"] = 100000
         invalid_config["grid_strategy"]["top_price"] = 90000
         
@@ -142,6 +171,27 @@ class TestActionCallbacks:
             }
         }
     
+    def test_shared_validator_keeps_results_per_thread(self):
+        """Concurrent callbacks on the shared validator do not see each other's errors."""
+        validator = self.action_callbacks.validator
+        invalid_config = copy.deepcopy(self.sample_config)
+        invalid_config["exchange"]["name"] = "unknown"
+        # Both threads validate before either reads its results back
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def validate_then_read(config):
+            validator.validate_config(config)
+            barrier.wait()
+            return list(validator.errors)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            invalid_future = executor.submit(validate_then_read, invalid_config)
+            valid_future = executor.submit(validate_then_read, self.sample_config)
+            invalid_errors, errors = invalid_future.result(), valid_future.result()
+        
+        assert any("Unsupported exchange" in error for error in invalid_errors)
+        assert not any("Unsupported exchange" in error for error in errors)
+    
     @patch('web_ui.validation.config_validator.UIConfigValidator.validate_config')
     def test_validation_success(self, mock_validate):
         """Test successful configuration validation."""
@@ -201,6 +251,21 @@ class TestActionCallbacks:
         assert success is False
         assert data == ""
         assert "Export failed" in error
+    
+    @patch('web_ui.utils.config_manager.ui_config_manager.export_config_for_download')
+    def test_repeated_export_is_ignored_per_client(self, mock_export):
+        """A repeat export is skipped only for the client whose store holds the matching fingerprint."""
+        mock_export.return_value = (True, "base64encodeddata", "config.json")
+        callback = next(entry['callback'] for key, entry in self.app.callback_map.items()
+                        if 'last-export-store.data' in key).__wrapped__
+        
+        *_, last_export = callback(1, self.sample_config, None)
+        
+        with pytest.raises(PreventUpdate):
+            callback(2, self.sample_config, last_export)
+        # Another client (empty store) still gets its export
+        assert callback(1, self.sample_config, None)[4]["data"] == "base64encodeddata"
+        assert mock_export.call_count == 2
 
 
 class TestInteractiveCallbacks:
@@ -294,10 +359,18 @@ class TestCallbackIntegration:
             }
         }
     
+    @pytest.mark.slow_ui
+    def test_building_the_app_does_not_start_the_price_feed(self):
+        """The websocket feed thread starts with the server, not with the app object."""
+        with patch.object(price_service.price_feed, 'start') as mock_start:
+            GridBotUI()
+        
+        mock_start.assert_not_called()
+    
     def test_config_to_visualization_flow(self):
         """Test configuration changes affecting visualizations."""
         # Simulate configuration change
-        new_config = self.sample_config.copy()
+        new_config = copy.deepcopy(self.sample_config)
         new_config["grid_strategy"]["num_grids"] = 15
         
         # Verify configuration change
@@ -352,14 +425,14 @@ class TestCallbackIntegration:
             'spacing_type': 'geometric'
         }
         
-        # Simulate sync to main config
-        updated_config = self.sample_config.copy()
-        updated_config["grid_strategy"].update(interactive_changes)
+        # Simulate sync to main config as a layered view over the base grid settings
+        updated_grid = ChainMap(interactive_changes, self.sample_config["grid_strategy"])
         
         # Verify sync
-        assert updated_config["grid_strategy"]["num_grids"] == 12
-        assert updated_config["grid_strategy"]["bottom_price"] == 88000
-        assert updated_config["grid_strategy"]["spacing_type"] == "geometric"
+        assert updated_grid["num_grids"] == 12
+        assert updated_grid["bottom_price"] == 88000
+        assert updated_grid["spacing_type"] == "geometric"
+        assert self.sample_config["grid_strategy"]["num_grids"] == 10
 
 
 class TestErrorHandling:
@@ -383,7 +456,7 @@ class TestErrorHandling:
         ]
         
         # Test error formatting
-        error_text = "\n".join([f"• {e}" for e in errors])
+        error_text = "\n".join(f"• {e}" for e in errors)
         assert "• Bottom price must be less than top price" in error_text
         assert "• Number of grids must be positive" in error_text
     
@@ -0,0 +1,50 @@
+"""
+Downsampling Tests for Grid Trading Bot Web UI
+
+Tests for the OHLCV aggregation applied before market data reaches the charts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from web_ui.utils.downsampling import downsample_ohlcv
+
+
+def _make_ohlcv(num_rows: int) -> pd.DataFrame:
+    """Build a seeded OHLCV frame with hourly timestamps."""
+    close = 95000 + np.random.default_rng(0).standard_normal(num_rows).cumsum() * 100
+    return pd.DataFrame({
+        'open': close - 10,
+        'high': close + 50,
+        'low': close - 50,
+        'close': close,
+        'volume': np.full(num_rows, 2.0)
+    }, index=pd.date_range(start='2024-01-01', periods=num_rows, freq='h'))
+
+
+class TestDownsampleOHLCV:
+    """Test cases for downsample_ohlcv."""
+
+    def test_small_frame_is_returned_unchanged(self):
+        """Frames that already fit are passed through as-is."""
+        df = _make_ohlcv(100)
+
+        assert downsample_ohlcv(df, max_points=100) is df
+
+    @pytest.mark.parametrize("num_rows,max_points", [(1000, 100), (1001, 100), (5000, 7)])
+    def test_bucket_aggregation_preserves_envelope(self, num_rows, max_points):
+        """Buckets keep the extremes, the boundary prices and the total volume."""
+        df = _make_ohlcv(num_rows)
+
+        result = downsample_ohlcv(df, max_points=max_points)
+
+        assert len(result) == max_points
+        assert list(result.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert result['high'].max() == df['high'].max()
+        assert result['low'].min() == df['low'].min()
+        assert result['open'].iloc[0] == df['open'].iloc[0]
+        assert result['close'].iloc[-1] == df['close'].iloc[-1]
+        assert result['volume'].sum() == pytest.approx(df['volume'].sum())
+        assert result.index[0] == df.index[0]
+        assert result.index.is_monotonic_increasing
@@ -4,50 +4,118 @@ End-to-End User Journey Tests for Grid Trading Bot Web UI
 Tests complete user workflows and interactions from start to finish.
 """
 
+import functools
 import pytest
-import sys
-import time
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
-import dash
-from dash import html, dcc
-from dash.testing.application_runners import import_app
-from dash.testing.composite import DashComposite
-import dash_bootstrap_components as dbc
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
 
-from web_ui.app import GridBotUI
+# Columnar record layout for simulated real-time update cycles
+UPDATE_CYCLE_DTYPE = np.dtype([('timestamp', 'datetime64[ns]'), ('price', 'f4'), ('volume', 'f4')])
+
+# Configuration validation rules, built once and evaluated in order (short-circuiting)
+_CONFIG_RULES = (
+    lambda config: all(field in config for field in ("exchange", "pair", "grid_strategy")),
+    lambda config: bool(config["exchange"].get("name")),
+    lambda config: bool(config["pair"].get("base_currency")) and bool(config["pair"].get("quote_currency")),
+    lambda config: config["grid_strategy"].get("num_grids", 0) > 0,
+    lambda config: config["grid_strategy"].get("bottom_price", float("-inf"))
+    < config["grid_strategy"].get("top_price", float("inf")),
+)
+
+
+def _build_ohlcv(rng, size, start, means, stds):
+    """Build a synthetic hourly float32 OHLCV frame from a single vectorized normal draw."""
+    dates = pd.Timestamp(start) + pd.to_timedelta(np.arange(size), unit='h')
+    data = rng.standard_normal((size, len(OHLCV_COLUMNS)), dtype=np.float32)
+    data *= np.array(stds, dtype=np.float32)
+    data += np.array(means, dtype=np.float32)
+    return pd.DataFrame(data, columns=OHLCV_COLUMNS, index=dates, copy=False)
+
+
+# Deterministic synthetic data, generated once at import; copy before mutating
+_RNG = np.random.default_rng(0xC0FFEE)
+_LARGE_OHLCV = _build_ohlcv(
+    _RNG, 10_000, '2020-01-01',
+    means=[50000, 51000, 49000, 50000, 100],
+    stds=[5000, 5000, 5000, 5000, 20]
+)
+_SMALL_OHLCV = _build_ohlcv(
+    _RNG, 100, '2024-01-01',
+    means=[95000, 96000, 94000, 95000, 100],
+    stds=[1000, 1000, 1000, 1000, 10]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _grid_stats(num_grids, bottom_price, top_price):
+    """Memoized grid statistics; the returned dict is shared and must not be mutated."""
+    price_range = top_price - bottom_price
+    return {
+        "price_range": price_range,
+        "mid_price": (bottom_price + top_price) / 2,
+        "avg_spacing": price_range / (num_grids - 1)
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_price_vs_grid(current_price, bottom_price, top_price):
+    """Memoized analysis of the current price vs grid range; the returned dict is shared and must not be mutated."""
+    if current_price < bottom_price:
+        return {"status": "below_grid", "distance": bottom_price - current_price}
+    elif current_price > top_price:
+        return {"status": "above_grid", "distance": current_price - top_price}
+    else:
+        return {"status": "within_grid", "position": (current_price - bottom_price) / (top_price - bottom_price)}
+
+
+@pytest.fixture(scope="session")
+def large_ohlcv_df():
+    """Large synthetic OHLCV dataset shared by the session."""
+    return _LARGE_OHLCV
+
+
+@pytest.fixture(scope="session")
+def small_ohlcv_df():
+    """Small synthetic OHLCV dataset used as mocked historical data."""
+    return _SMALL_OHLCV
+
+
+@pytest.fixture(scope="session")
+def ohlcv_stats(large_ohlcv_df):
+    """Close price statistics of the large dataset, computed once per session."""
+    return large_ohlcv_df['close'].agg(['min', 'max', 'mean', 'std']).to_dict()
+
+
+@pytest.fixture(scope="class")
+def sample_config():
+    """Sample configuration shared by a test class, read-only at every nesting level."""
+    return MappingProxyType({
+        "exchange": MappingProxyType({"name": "coinbase", "trading_fee": 0.005}),
+        "pair": MappingProxyType({"base_currency": "BTC", "quote_currency": "USD"}),
+        "trading_settings": MappingProxyType({"timeframe": "1h", "initial_balance": 10000}),
+        "grid_strategy": MappingProxyType({
+            "strategy_type": "simple_grid",
+            "spacing_type": "arithmetic",
+            "num_grids": 10,
+            "bottom_price": 90000,
+            "top_price": 100000
+        }),
+        "risk_management": MappingProxyType({
+            "take_profit": MappingProxyType({"enabled": False, "threshold": 5.0}),
+            "stop_loss": MappingProxyType({"enabled": False, "threshold": 10.0})
+        })
+    })
 
 
 class TestUserJourneys:
     """Test complete user journeys through the application."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.sample_config = {
-            "exchange": {"name": "coinbase", "trading_fee": 0.005},
-            "pair": {"base_currency": "BTC", "quote_currency": "USD"},
-            "trading_settings": {"timeframe": "1h", "initial_balance": 10000},
-            "grid_strategy": {
-                "strategy_type": "simple_grid",
-                "spacing_type": "arithmetic",
-                "num_grids": 10,
-                "bottom_price": 90000,
-                "top_price": 100000
-            },
-            "risk_management": {
-                "take_profit": {"enabled": False, "threshold": 5.0},
-                "stop_loss": {"enabled": False, "threshold": 10.0}
-            }
-        }
-    
     def test_complete_configuration_workflow(self):
         """Test complete configuration workflow from start to finish."""
         # Step 1: User starts with default configuration
@@ -93,24 +161,14 @@ class TestUserJourneys:
     
     @patch('web_ui.price_service.price_service.get_current_price_sync')
     @patch('web_ui.price_service.price_service.get_historical_data_sync')
-    def test_data_visualization_workflow(self, mock_historical, mock_current):
+    def test_data_visualization_workflow(self, mock_historical, mock_current, small_ohlcv_df, sample_config):
         """Test data visualization workflow."""
         # Mock data responses
         mock_current.return_value = 95000.50
-        
-        # Create mock historical data
-        dates = pd.date_range(start='2024-01-01', periods=100, freq='H')
-        mock_df = pd.DataFrame({
-            'open': np.random.normal(95000, 1000, 100),
-            'high': np.random.normal(96000, 1000, 100),
-            'low': np.random.normal(94000, 1000, 100),
-            'close': np.random.normal(95000, 1000, 100),
-            'volume': np.random.normal(100, 10, 100)
-        }, index=dates)
-        mock_historical.return_value = mock_df
+        mock_historical.return_value = small_ohlcv_df
         
         # Step 1: User selects trading pair
-        config = self.sample_config.copy()
+        config = sample_config
         
         # Step 2: System fetches current price
         current_price = mock_current(
@@ -131,24 +189,16 @@ class TestUserJourneys:
         assert historical_data is not None
         assert len(historical_data) == 100
         assert 'close' in historical_data.columns
-        
-        # Step 4: User views different visualization tabs
-        visualization_tabs = ["grid-tab", "interactive-tab", "chart-tab", "realtime-tab", "backtest-tab"]
-        
-        for tab in visualization_tabs:
-            # Simulate tab selection
-            active_tab = tab
-            assert active_tab in visualization_tabs
     
     @patch('web_ui.utils.config_manager.ui_config_manager.save_config')
     @patch('web_ui.utils.config_manager.ui_config_manager.export_config_for_download')
-    def test_configuration_management_workflow(self, mock_export, mock_save):
+    def test_configuration_management_workflow(self, mock_export, mock_save, sample_config):
         """Test configuration save and export workflow."""
         # Mock responses
         mock_save.return_value = (True, "/path/to/saved_config.json")
         mock_export.return_value = (True, "base64encodeddata", "exported_config.json")
         
-        config = self.sample_config.copy()
+        config = sample_config
         
         # Step 1: User validates configuration
         validation_result = self._validate_configuration(config)
@@ -232,13 +282,11 @@ class TestUserJourneys:
         assert len(errors) == 5
         
         # Step 3: User sees error notifications
-        error_notifications = []
-        for error in errors:
-            error_notifications.append({
-                "type": "error",
-                "message": error,
-                "timestamp": datetime.now()
-            })
+        timestamp = datetime.now()
+        error_notifications = [
+            {"type": "error", "message": error, "timestamp": timestamp}
+            for error in errors
+        ]
         
         assert len(error_notifications) == 5
         assert all(notif["type"] == "error" for notif in error_notifications)
@@ -260,147 +308,90 @@ class TestUserJourneys:
         assert is_valid is True
         assert len(errors) == 0
     
-    def test_real_time_updates_workflow(self):
+    def test_real_time_updates_workflow(self, sample_config):
         """Test real-time updates workflow."""
-        config = self.sample_config.copy()
+        config = sample_config
         
         # Step 1: User enables real-time monitoring
         real_time_enabled = True
         update_interval = 30  # seconds
         
-        # Step 2: System starts periodic updates
-        update_cycles = []
-        for cycle in range(3):  # Simulate 3 update cycles
-            # Simulate price update
-            current_price = 95000 + (cycle * 100)  # Price increases
-            
-            # Simulate market data update
-            market_data = {
-                'timestamp': datetime.now(),
-                'price': current_price,
-                'volume': 100 + (cycle * 10)
-            }
-            
-            update_cycles.append(market_data)
-            
-            # Simulate grid level analysis
-            grid_analysis = self._analyze_price_vs_grid(
-                current_price,
-                config["grid_strategy"]["bottom_price"],
-                config["grid_strategy"]["top_price"]
-            )
-            
-            update_cycles[-1]['grid_analysis'] = grid_analysis
+        # Step 2: System starts periodic updates (3 cycles, price and volume increasing).
+        # Grid analyses come from a shared cache and are only read here.
+        bottom_price = config["grid_strategy"]["bottom_price"]
+        top_price = config["grid_strategy"]["top_price"]
+        update_cycles = np.empty(3, dtype=UPDATE_CYCLE_DTYPE)
+        update_cycles['timestamp'] = np.datetime64(datetime.now())
+        update_cycles['price'] = 95000 + np.arange(3) * 100
+        update_cycles['volume'] = 100 + np.arange(3) * 10
+        grid_analyses = [
+            self._analyze_price_vs_grid(float(price), bottom_price, top_price)
+            for price in update_cycles['price']
+        ]
         
         # Verify update cycles
         assert len(update_cycles) == 3
-        assert update_cycles[0]['price'] == 95000
-        assert update_cycles[1]['price'] == 95100
-        assert update_cycles[2]['price'] == 95200
+        assert update_cycles['price'][0] == 95000
+        assert update_cycles['price'][1] == 95100
+        assert update_cycles['price'][2] == 95200
         
         # Verify all updates have grid analysis
-        assert all('grid_analysis' in cycle for cycle in update_cycles)
+        assert len(grid_analyses) == len(update_cycles)
+        assert all(analysis["status"] == "within_grid" for analysis in grid_analyses)
     
     def _validate_configuration(self, config):
         """Helper method to validate configuration."""
-        required_fields = ["exchange", "pair", "grid_strategy"]
-        
-        for field in required_fields:
-            if field not in config:
-                return False
-        
-        # Validate exchange
-        if not config["exchange"].get("name"):
-            return False
-        
-        # Validate pair
-        if not config["pair"].get("base_currency") or not config["pair"].get("quote_currency"):
-            return False
-        
-        # Validate grid strategy
-        grid = config["grid_strategy"]
-        if grid.get("num_grids", 0) <= 0:
-            return False
-        
-        if "bottom_price" in grid and "top_price" in grid:
-            if grid["bottom_price"] >= grid["top_price"]:
-                return False
-        
-        return True
+        return all(rule(config) for rule in _CONFIG_RULES)
     
     def _calculate_grid_levels(self, num_grids, bottom_price, top_price, spacing_type):
         """Helper method to calculate grid levels."""
         if spacing_type == "geometric":
-            ratio = (top_price / bottom_price) ** (1 / (num_grids - 1))
-            levels = [bottom_price * (ratio ** i) for i in range(num_grids)]
+            levels = np.geomspace(bottom_price, top_price, num_grids)
         else:  # arithmetic
-            step = (top_price - bottom_price) / (num_grids - 1)
-            levels = [bottom_price + (step * i) for i in range(num_grids)]
+            levels = np.linspace(bottom_price, top_price, num_grids)
         
-        return levels
+        return levels.tolist()
     
     def _calculate_grid_statistics(self, grid_config):
         """Helper method to calculate grid statistics."""
-        price_range = grid_config["top_price"] - grid_config["bottom_price"]
-        mid_price = (grid_config["bottom_price"] + grid_config["top_price"]) / 2
-        avg_spacing = price_range / (grid_config["num_grids"] - 1)
-        
-        return {
-            "price_range": price_range,
-            "mid_price": mid_price,
-            "avg_spacing": avg_spacing
-        }
+        return _grid_stats(grid_config["num_grids"], grid_config["bottom_price"], grid_config["top_price"])
     
-    def _analyze_price_vs_grid(self, current_price, bottom_price, top_price):
-        """Helper method to analyze current price vs grid range."""
-        if current_price < bottom_price:
-            return {"status": "below_grid", "distance": bottom_price - current_price}
-        elif current_price > top_price:
-            return {"status": "above_grid", "distance": current_price - top_price}
-        else:
-            return {"status": "within_grid", "position": (current_price - bottom_price) / (top_price - bottom_price)}
+    _analyze_price_vs_grid = staticmethod(_analyze_price_vs_grid)
 
 
+@pytest.mark.slow_ui
 class TestPerformanceScenarios:
     """Test performance-related scenarios."""
     
-    def test_large_dataset_handling(self):
+    # Pre-generated random operation durations for test_concurrent_operations
+    _DURATIONS = _RNG.uniform(0.1, 1.0, size=4)
+    
+    @staticmethod
+    def _process_dataset(df):
+        """Helper method to simulate data processing operations."""
+        return {
+            'total_records': len(df),
+            'date_range': (df.index.min(), df.index.max()),
+            'price_stats': df['close'].agg(['min', 'max', 'mean', 'std']).to_dict()
+        }
+    
+    def test_large_dataset_handling(self, benchmark, large_ohlcv_df):
         """Test handling of large datasets."""
-        # Simulate large historical dataset
         large_dataset_size = 10000
         
-        # Create mock large dataset
-        dates = pd.date_range(start='2020-01-01', periods=large_dataset_size, freq='H')
-        large_df = pd.DataFrame({
-            'open': np.random.normal(50000, 5000, large_dataset_size),
-            'high': np.random.normal(51000, 5000, large_dataset_size),
-            'low': np.random.normal(49000, 5000, large_dataset_size),
-            'close': np.random.normal(50000, 5000, large_dataset_size),
-            'volume': np.random.normal(100, 20, large_dataset_size)
-        }, index=dates)
-        
-        # Test data processing performance
-        start_time = time.time()
-        
-        # Simulate data processing operations
-        processed_data = {
-            'total_records': len(large_df),
-            'date_range': (large_df.index.min(), large_df.index.max()),
-            'price_stats': {
-                'min': large_df['close'].min(),
-                'max': large_df['close'].max(),
-                'mean': large_df['close'].mean(),
-                'std': large_df['close'].std()
-            }
-        }
-        
-        processing_time = time.time() - start_time
+        # Benchmark the data processing operations
+        processed_data = benchmark(self._process_dataset, large_ohlcv_df)
         
         # Verify processing completed successfully
         assert processed_data['total_records'] == large_dataset_size
-        assert processing_time < 5.0  # Should complete within 5 seconds
-        assert processed_data['price_stats']['min'] > 0
-        assert processed_data['price_stats']['max'] > processed_data['price_stats']['min']
+    
+    def test_large_dataset_min_price_positive(self, ohlcv_stats):
+        """Test the large dataset's minimum close price is positive."""
+        assert ohlcv_stats['min'] > 0
+    
+    def test_large_dataset_max_price_above_min(self, ohlcv_stats):
+        """Test the large dataset's maximum close price exceeds its minimum."""
+        assert ohlcv_stats['max'] > ohlcv_stats['min']
     
     def test_concurrent_operations(self):
         """Test concurrent operations handling."""
@@ -414,13 +405,13 @@ class TestPerformanceScenarios:
         
         # Simulate concurrent execution
         results = []
-        for operation in operations:
+        for operation, duration in zip(operations, self._DURATIONS):
             # Simulate operation execution
             result = {
                 "operation": operation["type"],
                 "status": "completed",
                 "timestamp": datetime.now(),
-                "duration": np.random.uniform(0.1, 1.0)  # Random duration
+                "duration": duration
             }
             results.append(result)
         
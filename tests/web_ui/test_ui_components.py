@@ -5,447 +5,416 @@ Tests for individual UI components including layout, forms, and visualizations.
 """
 
 import pytest
-import sys
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
-import dash
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+from dash.development.base_component import Component
 
 from web_ui.components.layout import LayoutComponents
 from web_ui.components.config_forms import ConfigForms
 from web_ui.components.visualizations import VisualizationComponents
 from web_ui.components.notifications import notification_system, NotificationType
 from web_ui.components.interactive_grid import interactive_grid
+from web_ui.price_service import price_service
+
+
+SAMPLE_CONFIG = MappingProxyType({
+    "exchange": MappingProxyType({"name": "coinbase", "trading_fee": 0.005, "trading_mode": "backtest"}),
+    "pair": MappingProxyType({"base_currency": "BTC", "quote_currency": "USD"}),
+    "trading_settings": MappingProxyType({
+        "timeframe": "1h",
+        "initial_balance": 10000,
+        "period": MappingProxyType({"start_date": "2024-06-10T00:00:00Z", "end_date": "2024-06-12T23:59:59Z"})
+    }),
+    "grid_strategy": MappingProxyType({
+        "type": "simple_grid",
+        "strategy_type": "simple_grid",
+        "spacing": "arithmetic",
+        "spacing_type": "arithmetic",
+        "num_grids": 10,
+        "range": MappingProxyType({"bottom": 90000, "top": 100000}),
+        "bottom_price": 90000,
+        "top_price": 100000
+    }),
+    "risk_management": MappingProxyType({
+        "take_profit": MappingProxyType({"enabled": False, "threshold": 5.0}),
+        "stop_loss": MappingProxyType({"enabled": False, "threshold": 10.0})
+    })
+})
+
+LATEST_MARKET_DATA = {
+    'key': 'coinbase_BTC/USD_1h',
+    'symbol': 'BTC/USD'
+}
+
+# Component factories bound once to the frozen sample config
+LAYOUT = LayoutComponents(SAMPLE_CONFIG)
+CONFIG_FORMS = ConfigForms(SAMPLE_CONFIG)
+
+# Hourly sample timestamps, built once at import
+_DATES = pd.date_range(start='2024-01-01', periods=100, freq='h')
+
+# Seeded OHLCV columns for the mocked historical frame
+_NOISE = np.random.default_rng(0).standard_normal((100, 5)) * [1000, 1000, 1000, 1000, 10]
+_OHLCV = {
+    'open': 95000 + _NOISE[:, 0],
+    'high': 96000 + _NOISE[:, 1],
+    'low': 94000 + _NOISE[:, 2],
+    'close': 95000 + _NOISE[:, 3],
+    'volume': 100 + _NOISE[:, 4]
+}
+_MOCK_DF = pd.DataFrame(_OHLCV, index=_DATES.as_unit('ms').rename('timestamp'))
+
+BACKTEST_PREVIEW = {
+    "performance_estimate": {
+        "total_return": 15.5,
+        "max_drawdown": 5.2,
+        "sharpe_ratio": 1.8
+    },
+    "market_analysis": {
+        "volatility": 12.3,
+        "trend": "sideways"
+    },
+    "recommendations": [
+        "Consider increasing grid levels",
+        "Monitor market volatility"
+    ]
+}
+
+# Notification factory cases: (factory name, args, kwargs, expected type, expected texts)
+NOTIFICATION_CASES = [
+    ("create_toast_container", (), {}, html.Div, ["toast-container"]),
+    ("create_toast", ("Operation successful", NotificationType.SUCCESS), {"title": "Success"},
+     dbc.Toast, ["success", "Operation successful"]),
+    ("create_toast", ("Operation failed", NotificationType.ERROR), {"title": "Error"},
+     dbc.Toast, ["danger", "Operation failed"]),
+    ("create_loading_spinner", (), {"size": "lg", "text": "Loading data..."}, html.Div, ["Loading data..."]),
+    ("create_progress_bar", (75,), {"max_value": 100, "label": "Processing..."}, html.Div, ["Processing...", "75"]),
+    ("create_status_indicator", ("success", "Operation completed"),
+     {"details": ["Step 1 completed", "Step 2 completed"]}, dbc.Alert, ["Operation completed", "Step 1 completed"])
+]
+NOTIFICATION_CASE_IDS = [
+    "toast_container", "toast_success", "toast_error", "loading_spinner", "progress_bar", "status_indicator"
+]
+
+# Expected 10-level grids between 90000 and 100000
+EXPECTED_ARITHMETIC_LEVELS = np.linspace(90000, 100000, 10)
+EXPECTED_GEOMETRIC_LEVELS = np.geomspace(90000, 100000, 10)
+
+
+def _iter_components(component):
+    """Yield every Dash component in a tree, following component-valued props."""
+    stack = [component]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            stack.extend(node)
+        elif isinstance(node, Component):
+            yield node
+            for prop in node._prop_names:
+                value = getattr(node, prop, None)
+                if isinstance(value, (Component, list, tuple)):
+                    stack.append(value)
+
+
+def _collect_ids(component):
+    """Collect the string ids of every component in a tree."""
+    return {node.id for node in _iter_components(component) if isinstance(getattr(node, "id", None), str)}
+
 
+def _collect_text(component):
+    """Join every scalar prop value (text, labels, class names, numbers) of a tree into one string."""
+    parts = []
+    for node in _iter_components(component):
+        for prop in node._prop_names:
+            value = getattr(node, prop, None)
+            values = value if isinstance(value, (list, tuple)) else (value,)
+            parts.extend(
+                str(item) for item in values
+                if isinstance(item, (str, int, float)) and not isinstance(item, bool)
+            )
+    return "\n".join(parts)
 
+
+@pytest.fixture(scope="module")
+def sample_market_data():
+    """Sample market-data-store payload pointing at the server-side cached frame, built once per module."""
+    with patch.dict(price_service.market_data_cache, {'coinbase_BTC/USD_1h': _MOCK_DF}):
+        yield {
+            'key': 'coinbase_BTC/USD_1h',
+            'symbol': 'BTC/USD',
+            'exchange': 'coinbase',
+            'base_currency': 'BTC',
+            'quote_currency': 'USD',
+            'timeframe': '1h'
+        }
+
+
+@pytest.fixture(scope="class")
+def mock_services():
+    """Patch the price and backtest services once per test class."""
+    with patch('web_ui.price_service.price_service.get_historical_data_sync') as mock_get_data, \
+            patch('web_ui.services.backtest_service.backtest_service.generate_backtest_preview') as mock_backtest:
+        mock_get_data.return_value = _MOCK_DF
+        mock_backtest.return_value = BACKTEST_PREVIEW
+        yield mock_get_data, mock_backtest
+
+
+@pytest.mark.slow_ui
+@pytest.mark.xdist_group(name="ui_layout")
 class TestLayoutComponents:
     """Test cases for layout components."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.sample_config = {
-            "exchange": {"name": "coinbase", "trading_fee": 0.005},
-            "pair": {"base_currency": "BTC", "quote_currency": "USD"},
-            "trading_settings": {"timeframe": "1h", "initial_balance": 10000},
-            "grid_strategy": {
-                "strategy_type": "simple_grid",
-                "spacing_type": "arithmetic",
-                "num_grids": 10,
-                "bottom_price": 90000,
-                "top_price": 100000
-            },
-            "risk_management": {
-                "take_profit": {"enabled": False, "threshold": 5.0},
-                "stop_loss": {"enabled": False, "threshold": 10.0}
-            }
-        }
-        self.layout_components = LayoutComponents(self.sample_config)
-    
     def test_create_header(self):
         """Test header creation."""
-        header = self.layout_components.create_header()
+        header = LAYOUT.create_header()
         
-        assert header is not None
         assert isinstance(header, dbc.Navbar)
         
         # Check for brand and title
-        header_html = str(header)
-        assert "Grid Trading Bot" in header_html
-        assert "Configuration" in header_html
+        text = _collect_text(header)
+        assert "Grid Trading Bot" in text
+        assert "Configuration" in text
     
     def test_create_config_panel(self):
         """Test configuration panel creation."""
-        config_panel = self.layout_components.create_config_panel()
+        config_panel = LAYOUT.create_config_panel()
         
-        assert config_panel is not None
         assert isinstance(config_panel, dbc.Card)
         
         # Check for configuration sections
-        panel_html = str(config_panel)
-        assert "Configuration" in panel_html
+        text = _collect_text(config_panel)
+        assert "Configuration" in text
     
     def test_create_visualization_panel(self):
         """Test visualization panel creation."""
-        viz_panel = self.layout_components.create_visualization_panel()
+        viz_panel = LAYOUT.create_visualization_panel()
         
-        assert viz_panel is not None
         assert isinstance(viz_panel, dbc.Card)
         
         # Check for tabs
-        panel_html = str(viz_panel)
-        assert "Grid Layout" in panel_html
-        assert "Interactive Grid" in panel_html
-        assert "Price Chart" in panel_html
-        assert "Real-time Monitor" in panel_html
-        assert "Backtest Preview" in panel_html
+        text = _collect_text(viz_panel)
+        assert "Grid Layout" in text
+        assert "Interactive Grid" in text
+        assert "Price Chart" in text
+        assert "Real-time Monitor" in text
+        assert "Backtest Preview" in text
     
     def test_create_footer(self):
         """Test footer creation."""
-        footer = self.layout_components.create_footer()
+        footer = LAYOUT.create_footer()
         
         assert footer is not None
         
         # Check for action buttons
-        footer_html = str(footer)
-        assert "validate-btn" in footer_html
-        assert "save-btn" in footer_html
-        assert "export-btn" in footer_html
+        ids = _collect_ids(footer)
+        assert "validate-btn" in ids
+        assert "save-btn" in ids
+        assert "export-btn" in ids
     
     def test_create_main_layout(self):
         """Test main layout creation."""
-        layout = self.layout_components.create_main_layout()
+        layout = LAYOUT.create_main_layout()
         
-        assert layout is not None
         assert isinstance(layout, dbc.Container)
         
         # Check for data stores
-        layout_html = str(layout)
-        assert "config-store" in layout_html
-        assert "market-data-store" in layout_html
-        assert "toast-container" in layout_html
+        ids = _collect_ids(layout)
+        assert "config-store" in ids
+        assert "market-data-store" in ids
+        assert "toast-container" in ids
 
 
+@pytest.mark.slow_ui
+@pytest.mark.xdist_group(name="ui_config_forms")
 class TestConfigForms:
     """Test cases for configuration forms."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.sample_config = {
-            "exchange": {"name": "coinbase", "trading_fee": 0.005},
-            "pair": {"base_currency": "BTC", "quote_currency": "USD"},
-            "trading_settings": {"timeframe": "1h", "initial_balance": 10000},
-            "grid_strategy": {
-                "strategy_type": "simple_grid",
-                "spacing_type": "arithmetic",
-                "num_grids": 10,
-                "bottom_price": 90000,
-                "top_price": 100000
-            }
-        }
-        self.config_forms = ConfigForms(self.sample_config)
-    
     def test_create_exchange_config(self):
         """Test exchange configuration form."""
-        exchange_form = self.config_forms.create_exchange_config()
+        exchange_form = CONFIG_FORMS.create_exchange_config()
         
         assert exchange_form is not None
         
         # Check for exchange selection
-        form_html = str(exchange_form)
-        assert "exchange-select" in form_html
-        assert "trading-fee-input" in form_html
+        ids = _collect_ids(exchange_form)
+        assert "exchange-select" in ids
+        assert "trading-fee-input" in ids
     
     def test_create_pair_config(self):
         """Test trading pair configuration form."""
-        pair_form = self.config_forms.create_pair_config()
+        pair_form = CONFIG_FORMS.create_pair_config()
         
         assert pair_form is not None
         
         # Check for currency inputs
-        form_html = str(pair_form)
-        assert "base-currency-input" in form_html
-        assert "quote-currency-input" in form_html
+        ids = _collect_ids(pair_form)
+        assert "base-currency-input" in ids
+        assert "quote-currency-input" in ids
     
     def test_create_grid_config(self):
         """Test grid strategy configuration form."""
-        grid_form = self.config_forms.create_grid_config()
+        grid_form = CONFIG_FORMS.create_grid_config()
         
         assert grid_form is not None
         
         # Check for grid parameters
-        form_html = str(grid_form)
-        assert "num-grids-input" in form_html
-        assert "bottom-price-input" in form_html
-        assert "top-price-input" in form_html
-        assert "spacing-type-select" in form_html
+        ids = _collect_ids(grid_form)
+        assert "num-grids-input" in ids
+        assert "bottom-price-input" in ids
+        assert "top-price-input" in ids
+        assert "spacing-type-select" in ids
     
     def test_create_trading_config(self):
         """Test trading settings configuration form."""
-        trading_form = self.config_forms.create_trading_config()
+        trading_form = CONFIG_FORMS.create_trading_config()
         
         assert trading_form is not None
         
         # Check for trading parameters
-        form_html = str(trading_form)
-        assert "timeframe-select" in form_html
-        assert "initial-balance-input" in form_html
+        ids = _collect_ids(trading_form)
+        assert "timeframe-select" in ids
+        assert "initial-balance-input" in ids
 
 
+@pytest.mark.usefixtures("mock_services")
+@pytest.mark.slow_ui
+@pytest.mark.xdist_group(name="ui_visualizations")
 class TestVisualizationComponents:
     """Test cases for visualization components."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.sample_config = {
-            "exchange": {"name": "coinbase"},
-            "pair": {"base_currency": "BTC", "quote_currency": "USD"},
-            "trading_settings": {"timeframe": "1h"},
-            "grid_strategy": {
-                "num_grids": 10,
-                "bottom_price": 90000,
-                "top_price": 100000,
-                "spacing_type": "arithmetic"
-            }
-        }
-        
-        # Sample market data
-        dates = pd.date_range(start='2024-01-01', periods=100, freq='H')
-        self.sample_market_data = {
-            'data': [
-                {
-                    'timestamp': int(date.timestamp() * 1000),
-                    'open': 95000 + np.random.randn() * 1000,
-                    'high': 96000 + np.random.randn() * 1000,
-                    'low': 94000 + np.random.randn() * 1000,
-                    'close': 95000 + np.random.randn() * 1000,
-                    'volume': 100 + np.random.randn() * 10
-                }
-                for date in dates
-            ],
-            'symbol': 'BTC/USD',
-            'exchange': 'coinbase',
-            'timeframe': '1h'
-        }
-    
     def test_create_grid_visualization(self):
         """Test grid visualization creation."""
-        grid_viz = VisualizationComponents.create_grid_visualization(self.sample_config)
+        grid_viz = VisualizationComponents.create_grid_visualization(SAMPLE_CONFIG)
         
         assert grid_viz is not None
         
         # Check for grid elements
-        viz_html = str(grid_viz)
-        assert "Grid Levels" in viz_html or "grid" in viz_html.lower()
+        text = _collect_text(grid_viz)
+        assert "Grid Levels" in text or "grid" in text.lower()
     
-    @patch('web_ui.price_service.price_service.get_historical_data_sync')
-    def test_create_price_chart_with_data(self, mock_get_data):
-        """Test price chart creation with market data."""
-        # Mock historical data
-        mock_df = pd.DataFrame(self.sample_market_data['data'])
-        mock_df['timestamp'] = pd.to_datetime(mock_df['timestamp'], unit='ms')
-        mock_df.set_index('timestamp', inplace=True)
-        mock_get_data.return_value = mock_df
+    def test_grid_visualization_keeps_zoom_across_range_changes(self):
+        """Moving the price range keeps the figure's uirevision, so client zoom survives."""
+        def uirevision(bottom, top):
+            config = {**SAMPLE_CONFIG, "grid_strategy": {**SAMPLE_CONFIG["grid_strategy"],
+                                                         "range": {"bottom": bottom, "top": top}}}
+            graph = next(node for node in _iter_components(
+                VisualizationComponents.create_grid_visualization(config)) if isinstance(node, dcc.Graph))
+            return graph.figure.layout.uirevision
+        
+        assert uirevision(90000, 100000) == "coinbase:BTC/USD:1h"
+        assert uirevision(91000, 99000) == uirevision(90000, 100000)
+    
+    def test_grid_visualization_builds_a_fresh_figure_per_call(self):
+        """Cached grid levels never hand the same mutable figure to two callers."""
+        def figure():
+            return next(node for node in _iter_components(
+                VisualizationComponents.create_grid_visualization(SAMPLE_CONFIG)) if isinstance(node, dcc.Graph)).figure
         
-        chart = VisualizationComponents.create_price_chart(self.sample_config, self.sample_market_data)
+        first = figure()
+        first.update_layout(title_text="mutated")
+        
+        assert figure() is not first
+        assert figure().layout.title.text != "mutated"
+    
+    def test_create_price_chart_with_data(self, sample_market_data):
+        """Test price chart creation with market data."""
+        chart = VisualizationComponents.create_price_chart(SAMPLE_CONFIG, sample_market_data)
         
         assert chart is not None
         
         # Should contain a graph component
-        chart_html = str(chart)
-        assert "dcc.Graph" in chart_html or "graph" in chart_html.lower()
+        text = _collect_text(chart)
+        assert any(isinstance(node, dcc.Graph) for node in _iter_components(chart)) or "graph" in text.lower()
     
-    @patch('web_ui.price_service.price_service.get_historical_data_sync')
-    def test_create_price_chart_no_data(self, mock_get_data):
+    def test_create_price_chart_no_data(self, mock_services):
         """Test price chart creation with no data."""
-        mock_get_data.return_value = None
+        mock_get_data, _ = mock_services
         
-        chart = VisualizationComponents.create_price_chart(self.sample_config, {})
+        with patch.object(mock_get_data, "return_value", None):
+            chart = VisualizationComponents.create_price_chart(SAMPLE_CONFIG, {})
         
         assert chart is not None
         
         # Should show loading or error state
-        chart_html = str(chart)
-        assert "loading" in chart_html.lower() or "error" in chart_html.lower() or "no data" in chart_html.lower()
+        text = _collect_text(chart)
+        assert "loading" in text.lower() or "error" in text.lower() or "no data" in text.lower()
     
-    @patch('web_ui.services.backtest_service.backtest_service.generate_backtest_preview')
-    def test_create_backtest_preview(self, mock_backtest):
+    def test_create_backtest_preview(self):
         """Test backtest preview creation."""
-        # Mock backtest data
-        mock_backtest.return_value = {
-            "performance_estimate": {
-                "total_return": 15.5,
-                "max_drawdown": 5.2,
-                "sharpe_ratio": 1.8
-            },
-            "market_analysis": {
-                "volatility": 12.3,
-                "trend": "sideways"
-            },
-            "recommendations": [
-                "Consider increasing grid levels",
-                "Monitor market volatility"
-            ]
-        }
-        
-        preview = VisualizationComponents.create_backtest_preview(self.sample_config)
+        preview = VisualizationComponents.create_backtest_preview(SAMPLE_CONFIG)
         
         assert preview is not None
         
         # Check for performance metrics
-        preview_html = str(preview)
-        assert "performance" in preview_html.lower() or "backtest" in preview_html.lower()
+        text = _collect_text(preview)
+        assert "performance" in text.lower() or "backtest" in text.lower()
 
 
+@pytest.mark.xdist_group(name="ui_notifications")
 class TestNotificationSystem:
     """Test cases for notification system."""
     
-    def test_create_toast_container(self):
-        """Test toast container creation."""
-        container = notification_system.create_toast_container()
+    @pytest.mark.parametrize("factory, args, kwargs, expected_type, expected_texts", NOTIFICATION_CASES,
+                             ids=NOTIFICATION_CASE_IDS)
+    def test_notification_factory(self, factory, args, kwargs, expected_type, expected_texts):
+        """Test each notification factory builds the expected component and content."""
+        component = getattr(notification_system, factory)(*args, **kwargs)
         
-        assert container is not None
-        assert isinstance(container, html.Div)
-        assert container.id == "toast-container"
-    
-    def test_create_toast_success(self):
-        """Test success toast creation."""
-        toast = notification_system.create_toast(
-            "Operation successful",
-            NotificationType.SUCCESS,
-            title="Success"
-        )
-        
-        assert toast is not None
-        assert isinstance(toast, dbc.Toast)
-        
-        # Check toast properties
-        toast_html = str(toast)
-        assert "success" in toast_html
-        assert "Operation successful" in toast_html
-    
-    def test_create_toast_error(self):
-        """Test error toast creation."""
-        toast = notification_system.create_toast(
-            "Operation failed",
-            NotificationType.ERROR,
-            title="Error"
-        )
-        
-        assert toast is not None
-        assert isinstance(toast, dbc.Toast)
-        
-        # Check toast properties
-        toast_html = str(toast)
-        assert "danger" in toast_html
-        assert "Operation failed" in toast_html
-    
-    def test_create_loading_spinner(self):
-        """Test loading spinner creation."""
-        spinner = notification_system.create_loading_spinner(
-            size="lg",
-            text="Loading data..."
-        )
-        
-        assert spinner is not None
-        assert isinstance(spinner, html.Div)
-        
-        # Check for spinner and text
-        spinner_html = str(spinner)
-        assert "Loading data..." in spinner_html
-    
-    def test_create_progress_bar(self):
-        """Test progress bar creation."""
-        progress = notification_system.create_progress_bar(
-            value=75,
-            max_value=100,
-            label="Processing..."
-        )
-        
-        assert progress is not None
-        assert isinstance(progress, html.Div)
-        
-        # Check for progress elements
-        progress_html = str(progress)
-        assert "Processing..." in progress_html
-        assert "75" in progress_html
-    
-    def test_create_status_indicator(self):
-        """Test status indicator creation."""
-        indicator = notification_system.create_status_indicator(
-            "success",
-            "Operation completed",
-            details=["Step 1 completed", "Step 2 completed"]
-        )
+        assert isinstance(component, expected_type)
         
-        assert indicator is not None
-        assert isinstance(indicator, dbc.Alert)
-        
-        # Check for status content
-        indicator_html = str(indicator)
-        assert "Operation completed" in indicator_html
-        assert "Step 1 completed" in indicator_html
+        text = _collect_text(component)
+        for expected in expected_texts:
+            assert expected in text
 
 
+@pytest.mark.xdist_group(name="ui_interactive_grid")
 class TestInteractiveGrid:
     """Test cases for interactive grid components."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.sample_config = {
-            "grid_strategy": {
-                "num_grids": 10,
-                "bottom_price": 90000,
-                "top_price": 100000,
-                "spacing_type": "arithmetic"
-            }
-        }
-        
-        self.sample_market_data = {
-            'data': [{'close': 95000}],
-            'symbol': 'BTC/USD'
-        }
-    
+    @pytest.mark.slow_ui
     def test_create_interactive_grid_editor(self):
         """Test interactive grid editor creation."""
-        editor = interactive_grid.create_interactive_grid_editor(self.sample_config)
+        editor = interactive_grid.create_interactive_grid_editor(SAMPLE_CONFIG)
         
-        assert editor is not None
         assert isinstance(editor, dbc.Card)
         
         # Check for interactive elements
-        editor_html = str(editor)
-        assert "interactive" in editor_html.lower()
-        assert "grid" in editor_html.lower()
+        text = _collect_text(editor)
+        assert "interactive" in text.lower()
+        assert "grid" in text.lower()
     
+    @pytest.mark.slow_ui
     def test_create_real_time_price_overlay(self):
         """Test real-time price overlay creation."""
-        overlay = interactive_grid.create_real_time_price_overlay(
-            self.sample_config, 
-            self.sample_market_data
-        )
+        with patch.dict(price_service.market_data_cache, {LATEST_MARKET_DATA['key']: _MOCK_DF}):
+            overlay = interactive_grid.create_real_time_price_overlay(
+                SAMPLE_CONFIG,
+                LATEST_MARKET_DATA
+            )
         
         assert overlay is not None
         
         # Check for price display elements
-        overlay_html = str(overlay)
-        assert "price" in overlay_html.lower() or "btc" in overlay_html.lower()
+        text = _collect_text(overlay)
+        assert "price" in text.lower() or "btc" in text.lower()
     
-    def test_generate_grid_levels_arithmetic(self):
-        """Test arithmetic grid level generation."""
-        levels = interactive_grid._generate_grid_levels(10, 90000, 100000, "arithmetic")
+    @pytest.mark.parametrize("spacing_type,expected", [
+        ("arithmetic", EXPECTED_ARITHMETIC_LEVELS),
+        ("geometric", EXPECTED_GEOMETRIC_LEVELS)
+    ])
+    def test_generate_grid_levels(self, spacing_type, expected):
+        """Test grid level generation for each spacing type."""
+        levels = interactive_grid._generate_grid_levels(10, 90000, 100000, spacing_type)
         
         assert len(levels) == 10
         assert levels[0] == 90000
         assert levels[-1] == 100000
-        
-        # Check arithmetic progression
-        step = (100000 - 90000) / 9
-        for i in range(1, len(levels)):
-            expected = 90000 + (step * i)
-            assert abs(levels[i] - expected) < 0.01
-    
-    def test_generate_grid_levels_geometric(self):
-        """Test geometric grid level generation."""
-        levels = interactive_grid._generate_grid_levels(10, 90000, 100000, "geometric")
-        
-        assert len(levels) == 10
-        assert levels[0] == 90000
-        assert levels[-1] == 100000
-        
-        # Check geometric progression
-        ratio = (100000 / 90000) ** (1 / 9)
-        for i in range(1, len(levels)):
-            expected = 90000 * (ratio ** i)
-            assert abs(levels[i] - expected) < 0.01
+        np.testing.assert_allclose(levels, expected, atol=0.01)
     
     def test_create_grid_level_indicators(self):
         """Test grid level indicators creation."""
@@ -455,12 +424,13 @@ class TestInteractiveGrid:
         indicators = interactive_grid._create_grid_level_indicators(levels, current_price)
         
         assert len(indicators) == len(levels)
-        assert all(isinstance(indicator, dbc.Row) for indicator in indicators)
         
-        # Check that indicators contain price information
-        indicators_html = str(indicators)
-        assert "90000" in indicators_html
-        assert "100000" in indicators_html
+        # Check row types and collect price text in a single pass
+        rows_and_text = [(isinstance(indicator, dbc.Row), _collect_text(indicator)) for indicator in indicators]
+        assert all(is_row for is_row, _ in rows_and_text)
+        text = " ".join(indicator_text for _, indicator_text in rows_and_text)
+        assert "90000" in text
+        assert "100000" in text
 
 
 if __name__ == "__main__":
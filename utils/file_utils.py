@@ -0,0 +1,35 @@
+import json
+import os
+import stat
+import uuid
+from typing import Any
+
+def atomic_write_json(data: Any, destination: str | os.PathLike) -> None:
+    """
+    Writes data as indented JSON, replacing the destination atomically.
+
+    The data is written to a temp file next to the destination and swapped in with
+    os.replace, so an interrupted write never leaves a truncated file behind. The temp
+    file keeps the destination's previous permissions; a new file is created with
+    0666 and the process umask applied, as a plain open() would.
+
+    Args:
+        data: JSON-serializable data to write.
+        destination: Path of the file to create or replace.
+    """
+    try:
+        previous_mode = stat.S_IMODE(os.stat(destination).st_mode)
+    except FileNotFoundError:
+        previous_mode = None
+
+    temp_path = f"{os.fspath(destination)}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        if previous_mode is not None:
+            os.chmod(temp_path, previous_mode)
+        os.replace(temp_path, destination)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
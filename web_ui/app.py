@@ -8,6 +8,7 @@ Built with Dash and Plotly for interactive visualizations.
 This is the refactored version with organized components and fixed duplicate callbacks.
 """
 
+import copy
 import os
 import sys
 import logging
@@ -20,17 +21,28 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 import dash
 import dash_bootstrap_components as dbc
+import orjson
+import plotly.io as pio
 from dotenv import load_dotenv
+from flask.json.provider import DefaultJSONProvider
 
-# Import organized components
-from web_ui.components.layout import LayoutComponents
-from web_ui.callbacks.main_callbacks import MainCallbacks
-from web_ui.callbacks.action_callbacks import ActionCallbacks
-from web_ui.callbacks.interactive_callbacks import InteractiveCallbacks
+from web_ui.price_service import price_service
 
 # Load environment variables
 load_dotenv()
 
+# Dash serializes layouts and callback payloads through plotly's JSON encoder;
+# pin it to orjson (native numpy, NaN -> null) instead of the stdlib fallback
+pio.json.config.default_engine = "orjson"
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that parses callback request bodies (store state included) with orjson."""
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,17 +62,20 @@ class GridBotUI:
             title="Grid Trading Bot Configuration",
             suppress_callback_exceptions=True
         )
+        self.app.server.json = ORJSONProvider(self.app.server)
         
         # Default configuration
         self.default_config = self._load_default_config()
-        self.current_config = self.default_config.copy()
+        self.current_config = copy.deepcopy(self.default_config)
         
         # Setup the layout and callbacks
         self._setup_layout()
         self._setup_callbacks()
     
-    def _load_default_config(self) -> Dict[str, Any]:
+    @staticmethod
+    def _load_default_config() -> Dict[str, Any]:
         """Load default configuration."""
+        now = datetime.now()
         return {
             "exchange": {
                 "name": "coinbase",
@@ -74,8 +89,8 @@ class GridBotUI:
             "trading_settings": {
                 "timeframe": "1h",
                 "period": {
-                    "start_date": (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "end_date": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                    "start_date": (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "end_date": now.strftime("%Y-%m-%dT%H:%M:%SZ")
                 },
                 "initial_balance": 10000
             },
@@ -106,11 +121,18 @@ class GridBotUI:
     
     def _setup_layout(self):
         """Setup the main layout of the application."""
+        # Imported here so importing this module (e.g. for the default config) stays light
+        from web_ui.components.layout import LayoutComponents
+
         layout_components = LayoutComponents(self.current_config)
         self.app.layout = layout_components.create_main_layout()
     
     def _setup_callbacks(self):
         """Setup all the callbacks for the application."""
+        from web_ui.callbacks.main_callbacks import MainCallbacks
+        from web_ui.callbacks.action_callbacks import ActionCallbacks
+        from web_ui.callbacks.interactive_callbacks import InteractiveCallbacks
+
         # Initialize callback classes
         main_callbacks = MainCallbacks(self.app)
         action_callbacks = ActionCallbacks(self.app)
@@ -122,9 +144,18 @@ class GridBotUI:
     def run(self, debug=True, port=8050):
         """Run the Dash application."""
         logger.info(f"Starting Grid Trading Bot UI on http://localhost:{port}")
+        # Stream live prices in the background so price callbacks read from memory
+        price_service.price_feed.start()
         self.app.run_server(debug=debug, port=port, host='0.0.0.0')
 
 
+def create_server():
+    """Create the Flask server backing the UI, for WSGI servers such as gunicorn."""
+    ui = GridBotUI()
+    price_service.price_feed.start()
+    return ui.app.server
+
+
 if __name__ == "__main__":
     ui = GridBotUI()
     ui.run(debug=True)
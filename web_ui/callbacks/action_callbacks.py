@@ -7,18 +7,73 @@ Contains callbacks for user actions like validation, saving, and price suggestio
 import json
 import logging
 import base64
+import hashlib
 import time
 from typing import Dict, Any
 
 import dash
-from dash import Input, Output, State, ctx, dcc, html
+from dash import Input, Output, State, Patch, ctx, dcc, html
+from dash.exceptions import PreventUpdate
 from web_ui.price_service import price_service
-from web_ui.validation.config_validator import UIConfigValidator
+from web_ui.validation.config_validator import ui_config_validator
 from web_ui.utils.config_manager import ui_config_manager
 from web_ui.components.notifications import notification_system, NotificationType
 
 logger = logging.getLogger(__name__)
 
+# Shared early-exit results; tuples are immutable so callbacks can return them as-is
+NO_ACTION_RESULT = ("", "info", False, dash.no_update)
+NO_PRICE_ACTION_RESULT = (dash.no_update, dash.no_update, dash.no_update, "", "info", False)
+NO_UPDATE_2 = (dash.no_update, dash.no_update)
+NO_IMPORT_RESULT = (dash.no_update, "", "info", False)
+
+# Seconds within which another export of an unchanged config is treated as a double-click
+EXPORT_REPEAT_WINDOW = 2.0
+
+# Browser-side field checks mirroring UIConfigValidator's trading_fee/num_grids rules.
+# The fee input is a percentage, the validator's limit is a 0.1 fraction.
+TRADING_FEE_VALIDATION_JS = """
+function(value) {
+    if (value === null || value === undefined) {
+        return [null, null];
+    }
+    const valid = value >= 0 && value <= 10;
+    return [valid, !valid];
+}
+"""
+
+NUM_GRIDS_VALIDATION_JS = """
+function(value) {
+    if (value === null || value === undefined) {
+        return [null, null];
+    }
+    const valid = Number.isInteger(value) && value >= 3 && value <= 100;
+    return [valid, !valid];
+}
+"""
+
+# Both bounds are positive and ordered, or neither price field is valid
+PRICE_RANGE_VALIDATION_JS = """
+function(bottom, top) {
+    if (bottom === null || bottom === undefined || top === null || top === undefined) {
+        return [null, null, null, null];
+    }
+    const valid = 0 < bottom && bottom < top;
+    return [valid, !valid, valid, !valid];
+}
+"""
+
+
+def _append_toast(toasts: Patch, message: str, notification_type: NotificationType, title: str,
+                  duration: int = 5000) -> Patch:
+    """Append a toast notification to a patched toast container."""
+    toasts.append(notification_system.create_toast(message, notification_type, title=title, duration=duration))
+    return toasts
+
+
+def _config_fingerprint(config: Dict[str, Any]) -> str:
+    """Stable digest of a configuration, small enough to keep in a browser store."""
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
 
 class ActionCallbacks:
     """Class containing all action callback functions."""
@@ -26,246 +81,170 @@ class ActionCallbacks:
     def __init__(self, app):
         """Initialize callbacks with the Dash app."""
         self.app = app
+        self.validator = ui_config_validator
         self.setup_callbacks()
     
     def setup_callbacks(self):
         """Setup all action callbacks."""
 
-        # Add loading state management
+        # One callback per action button, so a click only runs its own handler
         @self.app.callback(
-            [Output('status-alert', 'children'),
-             Output('status-alert', 'color'),
-             Output('status-alert', 'is_open'),
-             Output('validate-btn', 'disabled'),
-             Output('save-btn', 'disabled'),
-             Output('export-btn', 'disabled'),
-             Output('toast-container', 'children')],
-            [Input('validate-btn', 'n_clicks'),
-             Input('save-btn', 'n_clicks'),
-             Input('export-btn', 'n_clicks')],
-            [State('config-store', 'data'),
-             State('toast-container', 'children')]
+            [Output('status-alert', 'children', allow_duplicate=True),
+             Output('status-alert', 'color', allow_duplicate=True),
+             Output('status-alert', 'is_open', allow_duplicate=True),
+             Output('toast-container', 'children', allow_duplicate=True)],
+            [Input('validate-btn', 'n_clicks')],
+            [State('config-store', 'data')],
+            prevent_initial_call=True
         )
-        def handle_actions(validate_clicks, save_clicks, export_clicks, config_data, current_toasts):
-            """Handle action button clicks with loading states and notifications."""
-            if not ctx.triggered:
-                return "", "info", False, False, False, False, current_toasts or []
-
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-
-            # Initialize loading state
-            loading_buttons = {
-                'validate-btn': button_id == 'validate-btn',
-                'save-btn': button_id == 'save-btn',
-                'export-btn': button_id == 'export-btn'
-            }
+        def validate_config(validate_clicks, config_data):
+            """Validate the full configuration."""
+            if not validate_clicks:
+                return NO_ACTION_RESULT
+
+            # Append new toasts client-side instead of round-tripping the existing ones
+            toasts = Patch()
+            try:
+                # Comprehensive validation
+                is_valid, errors, warnings = self.validator.validate_config(config_data)
+
+                if is_valid:
+                    _append_toast(toasts, "Configuration validation completed successfully!",
+                                  NotificationType.SUCCESS, "Validation Complete")
+
+                    if warnings:
+                        warning_text = "\n".join([f"• {w}" for w in warnings])
+                        _append_toast(toasts, f"Warnings found:\n{warning_text}",
+                                      NotificationType.WARNING, "Validation Warnings", duration=8000)
+                        return f"✅ Configuration is valid!\n\nWarnings:\n{warning_text}", "warning", True, toasts
+                    return "✅ Configuration is valid! No issues found.", "success", True, toasts
 
-            toasts = current_toasts or []
-            
-            if button_id == 'validate-btn' and validate_clicks:
-                try:
-                    # Comprehensive validation
-                    validator = UIConfigValidator()
-                    is_valid, errors, warnings = validator.validate_config(config_data)
-
-                    if is_valid:
-                        success_toast = notification_system.create_toast(
-                            "Configuration validation completed successfully!",
-                            NotificationType.SUCCESS,
-                            title="Validation Complete"
-                        )
-                        toasts.append(success_toast)
-
-                        if warnings:
-                            warning_text = "\n".join([f"• {w}" for w in warnings])
-                            warning_toast = notification_system.create_toast(
-                                f"Warnings found:\n{warning_text}",
-                                NotificationType.WARNING,
-                                title="Validation Warnings",
-                                duration=8000
-                            )
-                            toasts.append(warning_toast)
-                            return f"✅ Configuration is valid!\n\nWarnings:\n{warning_text}", "warning", True, False, False, False, toasts
-                        else:
-                            return "✅ Configuration is valid! No issues found.", "success", True, False, False, False, toasts
-                    else:
-                        error_text = "\n".join([f"• {e}" for e in errors])
-                        warning_text = "\n".join([f"• {w}" for w in warnings]) if warnings else ""
-
-                        error_toast = notification_system.create_toast(
-                            f"Configuration has {len(errors)} error(s)",
-                            NotificationType.ERROR,
-                            title="Validation Failed",
-                            duration=10000
-                        )
-                        toasts.append(error_toast)
-
-                        message = f"❌ Configuration has errors:\n{error_text}"
-                        if warning_text:
-                            message += f"\n\nWarnings:\n{warning_text}"
-
-                        return message, "danger", True, False, False, False, toasts
-
-                except Exception as e:
-                    error_toast = notification_system.create_toast(
-                        f"Validation failed: {str(e)}",
-                        NotificationType.ERROR,
-                        title="Validation Error"
-                    )
-                    toasts.append(error_toast)
-                    return f"❌ Validation error: {str(e)}", "danger", True, False, False, False, toasts
-            
-            elif button_id == 'save-btn' and save_clicks:
-                try:
-                    # Add loading toast
-                    loading_toast = notification_system.create_toast(
-                        "Saving configuration...",
-                        NotificationType.LOADING,
-                        title="Save in Progress",
-                        duration=0,
-                        dismissible=False
-                    )
-                    toasts.append(loading_toast)
-
-                    # Save configuration using config manager
-                    success, result = ui_config_manager.save_config(config_data)
-
-                    # Remove loading toast
-                    toasts = [t for t in toasts if t != loading_toast]
-
-                    if success:
-                        success_toast = notification_system.create_toast(
-                            f"Configuration saved successfully",
-                            NotificationType.SUCCESS,
-                            title="Save Complete"
-                        )
-                        toasts.append(success_toast)
-                        return f"✅ Configuration saved to {result}", "success", True, False, False, False, toasts
-                    else:
-                        error_toast = notification_system.create_toast(
-                            f"Failed to save configuration: {result}",
-                            NotificationType.ERROR,
-                            title="Save Failed"
-                        )
-                        toasts.append(error_toast)
-                        return f"❌ Save error: {result}", "danger", True, False, False, False, toasts
-                except Exception as e:
-                    error_toast = notification_system.create_toast(
-                        f"Save failed: {str(e)}",
-                        NotificationType.ERROR,
-                        title="Save Error"
-                    )
-                    toasts.append(error_toast)
-                    return f"❌ Save error: {str(e)}", "danger", True, False, False, False, toasts
-
-            elif button_id == 'export-btn' and export_clicks:
-                try:
-                    # Add loading toast
-                    loading_toast = notification_system.create_toast(
-                        "Preparing configuration for export...",
-                        NotificationType.LOADING,
-                        title="Export in Progress",
-                        duration=0,
-                        dismissible=False
-                    )
-                    toasts.append(loading_toast)
-
-                    # Export configuration for download
-                    success, base64_data, filename = ui_config_manager.export_config_for_download(config_data)
-
-                    # Remove loading toast
-                    toasts = [t for t in toasts if t != loading_toast]
-
-                    if success:
-                        success_toast = notification_system.create_toast(
-                            f"Configuration ready for download as {filename}",
-                            NotificationType.SUCCESS,
-                            title="Export Complete"
-                        )
-                        toasts.append(success_toast)
-                        return f"✅ Configuration ready for download as {filename}", "success", True, False, False, False, toasts
-                    else:
-                        error_toast = notification_system.create_toast(
-                            f"Export failed: {base64_data}",
-                            NotificationType.ERROR,
-                            title="Export Failed"
-                        )
-                        toasts.append(error_toast)
-                        return f"❌ Export error: {base64_data}", "danger", True, False, False, False, toasts
-                except Exception as e:
-                    error_toast = notification_system.create_toast(
-                        f"Export failed: {str(e)}",
-                        NotificationType.ERROR,
-                        title="Export Error"
-                    )
-                    toasts.append(error_toast)
-                    return f"❌ Export error: {str(e)}", "danger", True, False, False, False, toasts
-
-            return "", "info", False, False, False, False, toasts
+                error_text = "\n".join([f"• {e}" for e in errors])
+                warning_text = "\n".join([f"• {w}" for w in warnings]) if warnings else ""
+
+                _append_toast(toasts, f"Configuration has {len(errors)} error(s)",
+                              NotificationType.ERROR, "Validation Failed", duration=10000)
+
+                message = f"❌ Configuration has errors:\n{error_text}"
+                if warning_text:
+                    message += f"\n\nWarnings:\n{warning_text}"
+
+                return message, "danger", True, toasts
+
+            except Exception as e:
+                _append_toast(toasts, f"Validation failed: {str(e)}", NotificationType.ERROR, "Validation Error")
+                return f"❌ Validation error: {str(e)}", "danger", True, toasts
 
         @self.app.callback(
-            [Output('stat-current-price', 'children'),
-             Output('status-alert', 'children', allow_duplicate=True),
+            [Output('status-alert', 'children', allow_duplicate=True),
              Output('status-alert', 'color', allow_duplicate=True),
-             Output('status-alert', 'is_open', allow_duplicate=True)],
-            [Input('get-price-btn', 'n_clicks')],
-            [State('base-currency-input', 'value'),
-             State('quote-currency-input', 'value'),
-             State('exchange-select', 'value')],
+             Output('status-alert', 'is_open', allow_duplicate=True),
+             Output('toast-container', 'children', allow_duplicate=True)],
+            [Input('save-btn', 'n_clicks')],
+            [State('config-store', 'data')],
             prevent_initial_call=True
         )
-        def get_current_price(n_clicks, base_currency, quote_currency, exchange):
-            """Get and display current price for the selected trading pair."""
-            if not n_clicks or not base_currency or not quote_currency or not exchange:
-                return dash.no_update, "", "info", False
+        def save_config(save_clicks, config_data):
+            """Save the configuration using the config manager."""
+            if not save_clicks:
+                return NO_ACTION_RESULT
 
+            toasts = Patch()
             try:
-                # Get current price
-                current_price = price_service.get_current_price_sync(exchange, base_currency, quote_currency)
+                success, result = ui_config_manager.save_config(config_data)
 
-                if current_price:
-                    price_display = f"${current_price:,.2f}"
-                    message = f"✅ Current price fetched: ${current_price:,.2f} for {base_currency}/{quote_currency}"
-                    return price_display, message, "success", True
-                else:
-                    return dash.no_update, "❌ Unable to fetch current price", "danger", True
+                if success:
+                    _append_toast(toasts, "Configuration saved successfully", NotificationType.SUCCESS, "Save Complete")
+                    return f"✅ Configuration saved to {result}", "success", True, toasts
 
+                _append_toast(toasts, f"Failed to save configuration: {result}", NotificationType.ERROR, "Save Failed")
+                return f"❌ Save error: {result}", "danger", True, toasts
             except Exception as e:
-                logger.error(f"Error fetching current price: {e}")
-                return dash.no_update, f"❌ Error: {str(e)}", "danger", True
+                _append_toast(toasts, f"Save failed: {str(e)}", NotificationType.ERROR, "Save Error")
+                return f"❌ Save error: {str(e)}", "danger", True, toasts
 
         @self.app.callback(
-            [Output('bottom-price-input', 'value'),
+            [Output('status-alert', 'children', allow_duplicate=True),
+             Output('status-alert', 'color', allow_duplicate=True),
+             Output('status-alert', 'is_open', allow_duplicate=True),
+             Output('toast-container', 'children', allow_duplicate=True),
+             Output('export-cache', 'data'),
+             Output('last-export-store', 'data')],
+            [Input('export-btn', 'n_clicks')],
+            [State('config-store', 'data'),
+             State('last-export-store', 'data')],
+            prevent_initial_call=True
+        )
+        def export_config(export_clicks, config_data, last_export):
+            """Encode the configuration for browser download."""
+            if not export_clicks:
+                return NO_ACTION_RESULT + (dash.no_update, dash.no_update)
+
+            # This client just exported the same config; don't encode and download it a second time
+            fingerprint = _config_fingerprint(config_data)
+            now = time.time()
+            if (last_export and last_export.get("fingerprint") == fingerprint
+                    and now - last_export.get("at", 0.0) < EXPORT_REPEAT_WINDOW):
+                raise PreventUpdate
+
+            toasts = Patch()
+            try:
+                success, base64_data, filename = ui_config_manager.export_config_for_download(config_data)
+
+                if success:
+                    _append_toast(toasts, f"Configuration ready for download as {filename}",
+                                  NotificationType.SUCCESS, "Export Complete")
+                    return (f"✅ Configuration ready for download as {filename}", "success", True, toasts,
+                            {"data": base64_data, "filename": filename},
+                            {"fingerprint": fingerprint, "at": now})
+
+                _append_toast(toasts, f"Export failed: {base64_data}", NotificationType.ERROR, "Export Failed")
+                return f"❌ Export error: {base64_data}", "danger", True, toasts, dash.no_update, dash.no_update
+            except Exception as e:
+                _append_toast(toasts, f"Export failed: {str(e)}", NotificationType.ERROR, "Export Error")
+                return f"❌ Export error: {str(e)}", "danger", True, toasts, dash.no_update, dash.no_update
+
+        @self.app.callback(
+            [Output('stat-current-price', 'children'),
+             Output('bottom-price-input', 'value'),
              Output('top-price-input', 'value'),
              Output('status-alert', 'children', allow_duplicate=True),
              Output('status-alert', 'color', allow_duplicate=True),
              Output('status-alert', 'is_open', allow_duplicate=True)],
-            [Input('suggest-range-btn', 'n_clicks')],
-            [State('base-currency-input', 'value'),
-             State('quote-currency-input', 'value'),
-             State('exchange-select', 'value')],
+            [Input('get-price-btn', 'n_clicks'),
+             Input('suggest-range-btn', 'n_clicks')],
+            [State('symbol-store', 'data')],
             prevent_initial_call=True
         )
-        def suggest_price_range(n_clicks, base_currency, quote_currency, exchange):
-            """Suggest price range based on current market price."""
-            if not n_clicks or not base_currency or not quote_currency or not exchange:
-                return dash.no_update, dash.no_update, "", "info", False
-            
+        def handle_price_actions(price_clicks, suggest_clicks, symbol_data):
+            """Fetch the current price or suggest a grid range from it, depending on the button clicked."""
+            button_id = ctx.triggered_id
+            clicks = price_clicks if button_id == 'get-price-btn' else suggest_clicks
+            if not clicks or not symbol_data:
+                return NO_PRICE_ACTION_RESULT
+
             try:
                 # Get current price
-                current_price = price_service.get_current_price_sync(exchange, base_currency, quote_currency)
-                
-                if current_price:
-                    # Suggest range based on current price
-                    bottom, top = price_service.get_price_range_suggestion(current_price)
-                    message = f"Range suggested based on current price ${current_price:,.2f}"
-                    return bottom, top, message, "success", True
-                else:
-                    return dash.no_update, dash.no_update, "Unable to fetch current price", "danger", True
-                    
+                current_price = price_service.get_current_price_sync(
+                    symbol_data["exchange"], symbol_data["base_currency"], symbol_data["quote_currency"]
+                )
+
+                if not current_price:
+                    return dash.no_update, dash.no_update, dash.no_update, "❌ Unable to fetch current price", "danger", True
+
+                if button_id == 'get-price-btn':
+                    price_display = f"${current_price:,.2f}"
+                    message = f"✅ Current price fetched: ${current_price:,.2f} for {symbol_data['symbol']}"
+                    return price_display, dash.no_update, dash.no_update, message, "success", True
+
+                # Suggest range based on current price
+                bottom, top = price_service.get_price_range_suggestion(current_price)
+                message = f"Range suggested based on current price ${current_price:,.2f}"
+                return dash.no_update, bottom, top, message, "success", True
+
             except Exception as e:
-                logger.error(f"Error suggesting price range: {e}")
-                return dash.no_update, dash.no_update, f"Error: {str(e)}", "danger", True
+                logger.error(f"Error handling price action: {e}")
+                return dash.no_update, dash.no_update, dash.no_update, f"❌ Error: {str(e)}", "danger", True
 
         # Popular pair selection callbacks
         @self.app.callback(
@@ -282,12 +261,12 @@ class ActionCallbacks:
         def select_popular_pair(*n_clicks_list):
             """Handle popular pair button clicks."""
             if not any(n_clicks_list):
-                return dash.no_update, dash.no_update
+                return NO_UPDATE_2
 
             # Determine which button was clicked
             ctx_triggered = ctx.triggered[0] if ctx.triggered else None
             if not ctx_triggered:
-                return dash.no_update, dash.no_update
+                return NO_UPDATE_2
 
             button_id = ctx_triggered['prop_id'].split('.')[0]
 
@@ -305,7 +284,7 @@ class ActionCallbacks:
                 base, quote = pair_mapping[button_id]
                 return base, quote
 
-            return dash.no_update, dash.no_update
+            return NO_UPDATE_2
 
         # Quick date selection callbacks
         @self.app.callback(
@@ -320,12 +299,12 @@ class ActionCallbacks:
         def select_quick_date_range(*n_clicks_list):
             """Handle quick date range button clicks."""
             if not any(n_clicks_list):
-                return dash.no_update, dash.no_update
+                return NO_UPDATE_2
 
             # Determine which button was clicked
             ctx_triggered = ctx.triggered[0] if ctx.triggered else None
             if not ctx_triggered:
-                return dash.no_update, dash.no_update
+                return NO_UPDATE_2
 
             button_id = ctx_triggered['prop_id'].split('.')[0]
 
@@ -342,7 +321,7 @@ class ActionCallbacks:
             elif button_id == 'date-1y':
                 start_date = end_date - timedelta(days=365)
             else:
-                return dash.no_update, dash.no_update
+                return NO_UPDATE_2
 
             # Format dates for datetime-local input
             start_str = start_date.strftime('%Y-%m-%dT%H:%M')
@@ -350,36 +329,23 @@ class ActionCallbacks:
 
             return start_str, end_str
 
-        # Real-time field validation callbacks
-        @self.app.callback(
+        # Real-time field validation runs in the browser, no server round trip per keystroke
+        self.app.clientside_callback(
+            TRADING_FEE_VALIDATION_JS,
             [Output('trading-fee-input', 'valid'),
              Output('trading-fee-input', 'invalid')],
             [Input('trading-fee-input', 'value')]
         )
-        def validate_trading_fee(value):
-            """Real-time validation for trading fee."""
-            if value is None:
-                return None, None
 
-            validator = UIConfigValidator()
-            is_valid, _ = validator.validate_field("trading_fee", value / 100 if value else 0)
-            return is_valid, not is_valid
-
-        @self.app.callback(
+        self.app.clientside_callback(
+            NUM_GRIDS_VALIDATION_JS,
             [Output('num-grids-input', 'valid'),
              Output('num-grids-input', 'invalid')],
             [Input('num-grids-input', 'value')]
         )
-        def validate_num_grids(value):
-            """Real-time validation for number of grids."""
-            if value is None:
-                return None, None
-
-            validator = UIConfigValidator()
-            is_valid, _ = validator.validate_field("num_grids", value)
-            return is_valid, not is_valid
 
-        @self.app.callback(
+        self.app.clientside_callback(
+            PRICE_RANGE_VALIDATION_JS,
             [Output('bottom-price-input', 'valid'),
              Output('bottom-price-input', 'invalid'),
              Output('top-price-input', 'valid'),
@@ -387,21 +353,6 @@ class ActionCallbacks:
             [Input('bottom-price-input', 'value'),
              Input('top-price-input', 'value')]
         )
-        def validate_price_range(bottom_price, top_price):
-            """Real-time validation for price range."""
-            if bottom_price is None or top_price is None:
-                return None, None, None, None
-
-            # Individual validations
-            bottom_valid = bottom_price > 0 if bottom_price is not None else False
-            top_valid = top_price > 0 if top_price is not None else False
-
-            # Range validation
-            if bottom_price and top_price and bottom_price >= top_price:
-                bottom_valid = False
-                top_valid = False
-
-            return bottom_valid, not bottom_valid, top_valid, not top_valid
 
         # Import/Export callbacks
         @self.app.callback(
@@ -416,12 +367,12 @@ class ActionCallbacks:
         def import_config(contents, filename):
             """Import configuration from uploaded file."""
             if contents is None:
-                return dash.no_update, "", "info", False
+                return NO_IMPORT_RESULT
 
             try:
-                # Decode the uploaded file
-                content_type, content_string = contents.split(',')
-                decoded = base64.b64decode(content_string).decode('utf-8')
+                # Decode the uploaded file; the JSON parser reads the UTF-8 bytes directly
+                content_type, _, content_string = contents.partition(',')
+                decoded = base64.b64decode(content_string)
 
                 # Import configuration
                 success, config, message = ui_config_manager.import_config_from_upload(decoded)
@@ -436,45 +387,34 @@ class ActionCallbacks:
 
         @self.app.callback(
             Output('download-config', 'children'),
-            [Input('export-btn', 'n_clicks')],
-            [State('config-store', 'data')],
+            [Input('export-cache', 'data')],
             prevent_initial_call=True
         )
-        def export_config_download(n_clicks, config_data):
-            """Create download link for configuration export."""
-            if not n_clicks or not config_data:
+        def export_config_download(export_data):
+            """Create download link for the configuration exported by the export button."""
+            if not export_data:
                 return ""
 
-            try:
-                success, base64_data, filename = ui_config_manager.export_config_for_download(config_data)
-
-                if success:
-                    # Create download link
-                    download_link = html.A(
-                        "Download Configuration",
-                        id="download-link",
-                        download=filename,
-                        href=f"data:application/json;base64,{base64_data}",
-                        target="_blank",
-                        style={"display": "none"}
-                    )
-
-                    # Auto-trigger download
-                    return html.Div([
-                        download_link,
-                        dcc.Interval(
-                            id="download-trigger",
-                            interval=100,
-                            n_intervals=0,
-                            max_intervals=1
-                        )
-                    ])
-                else:
-                    return ""
-
-            except Exception as e:
-                logger.error(f"Export download error: {e}")
-                return ""
+            # Reuse the payload export_config already serialized and encoded
+            download_link = html.A(
+                "Download Configuration",
+                id="download-link",
+                download=export_data["filename"],
+                href=f"data:application/json;base64,{export_data['data']}",
+                target="_blank",
+                style={"display": "none"}
+            )
+
+            # Auto-trigger download
+            return html.Div([
+                download_link,
+                dcc.Interval(
+                    id="download-trigger",
+                    interval=100,
+                    n_intervals=0,
+                    max_intervals=1
+                )
+            ])
 
         # Help system callbacks
         @self.app.callback(
@@ -12,15 +12,123 @@ from datetime import datetime
 
 import dash
 import dash_bootstrap_components as dbc
-from dash import html, Input, Output, State, ctx, callback
+from dash import html, Input, Output, State, Patch, ctx, callback
 import plotly.graph_objects as go
+import numpy as np
 from web_ui.components.interactive_grid import interactive_grid
 from web_ui.components.notifications import notification_system, NotificationType
 from web_ui.price_service import price_service
+from web_ui.utils.plotting import chart_uirevision, format_price_labels, grid_label_trace, grid_line_trace
 
 logger = logging.getLogger(__name__)
 
 
+def _build_interactive_grid(num_grids: int, bottom_price: float, top_price: float, spacing_type: str,
+                            uirevision: str):
+    """Build a fresh interactive grid figure and statistics from the cached grid levels."""
+    # Generate grid levels (an immutable tuple, cached on the grid parameters)
+    grid_levels = interactive_grid._generate_grid_levels(
+        num_grids, bottom_price, top_price, spacing_type
+    )
+
+    # Create figure
+    fig = go.Figure()
+
+    # Add grid lines as one WebGL trace per side of the mid price
+    mid_price = (bottom_price + top_price) / 2
+    # Levels are ascending, so everything before the mid price index is a buy level
+    num_buy_levels = int(np.searchsorted(grid_levels, mid_price))
+    buy_levels = grid_levels[:num_buy_levels]
+    sell_levels = grid_levels[num_buy_levels:]
+    fig.add_trace(grid_line_trace(buy_levels, "green", "Buy levels", x_range=(0, 100), width=2))
+    fig.add_trace(grid_line_trace(sell_levels, "red", "Sell levels", x_range=(0, 100), width=2))
+
+    level_colors = ["green"] * len(buy_levels) + ["red"] * len(sell_levels)
+    fig.add_trace(grid_label_trace(
+        grid_levels, format_price_labels(grid_levels, "${:.2f}"), level_colors, x=100
+    ))
+
+    # Add price range background
+    fig.add_hrect(
+        y0=bottom_price,
+        y1=top_price,
+        fillcolor="lightblue",
+        opacity=0.1,
+        layer="below",
+        line_width=0
+    )
+
+    # Add mid-line
+    fig.add_hline(
+        y=mid_price,
+        line_dash="dot",
+        line_color="purple",
+        line_width=3,
+        annotation_text=f"Mid: ${mid_price:.2f}",
+        annotation_position="left"
+    )
+
+    # Configure layout
+    fig.update_layout(
+        title=f"Interactive Grid - {num_grids} Levels ({spacing_type.title()} Spacing)",
+        xaxis_title="Time",
+        yaxis_title="Price ($)",
+        height=400,
+        showlegend=False,
+        yaxis=dict(
+            range=[bottom_price * 0.95, top_price * 1.05],
+            tickformat=".2f"
+        ),
+        xaxis=dict(
+            range=[0, 100],  # Dummy time range
+            showticklabels=False
+        ),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        # Keep the user's zoom until the exchange, pair or timeframe changes
+        uirevision=uirevision
+    )
+
+    # Generate statistics
+    price_range = top_price - bottom_price
+    avg_spacing = price_range / (num_grids - 1)
+
+    if spacing_type == "geometric":
+        ratio = (top_price / bottom_price) ** (1 / (num_grids - 1))
+        spacing_info = f"Ratio: {ratio:.4f}"
+    else:
+        spacing_info = f"Step: ${avg_spacing:.2f}"
+
+    stats = dbc.Row([
+        dbc.Col([
+            html.Small([
+                html.Strong("Range: "),
+                f"${price_range:.2f}"
+            ])
+        ], width=3),
+        dbc.Col([
+            html.Small([
+                html.Strong("Avg Spacing: "),
+                f"${avg_spacing:.2f}"
+            ])
+        ], width=3),
+        dbc.Col([
+            html.Small([
+                html.Strong("Spacing Info: "),
+                spacing_info
+            ])
+        ], width=3),
+        dbc.Col([
+            html.Small([
+                html.Strong("Mid Price: "),
+                f"${mid_price:.2f}"
+            ])
+        ], width=3)
+    ], className="text-muted")
+
+    return fig, stats
+
+
 class InteractiveCallbacks:
     """Class containing all interactive callback functions."""
     
@@ -52,112 +160,8 @@ class InteractiveCallbacks:
                 if bottom_price >= top_price:
                     return {}, "Bottom price must be less than top price"
                 
-                # Generate grid levels
-                grid_levels = interactive_grid._generate_grid_levels(
-                    num_grids, bottom_price, top_price, spacing_type
-                )
-                
-                # Create figure
-                fig = go.Figure()
-                
-                # Add grid lines with different colors for buy/sell levels
-                mid_price = (bottom_price + top_price) / 2
-                
-                for i, level in enumerate(grid_levels):
-                    color = "green" if level < mid_price else "red"
-                    line_style = "solid" if i % 2 == 0 else "dash"
-                    
-                    fig.add_hline(
-                        y=level,
-                        line_dash=line_style,
-                        line_color=color,
-                        line_width=2,
-                        annotation_text=f"${level:.2f}",
-                        annotation_position="right",
-                        annotation=dict(
-                            bgcolor=color,
-                            bordercolor=color,
-                            font=dict(color="white", size=10)
-                        )
-                    )
-                
-                # Add price range background
-                fig.add_hrect(
-                    y0=bottom_price,
-                    y1=top_price,
-                    fillcolor="lightblue",
-                    opacity=0.1,
-                    layer="below",
-                    line_width=0
-                )
-                
-                # Add mid-line
-                fig.add_hline(
-                    y=mid_price,
-                    line_dash="dot",
-                    line_color="purple",
-                    line_width=3,
-                    annotation_text=f"Mid: ${mid_price:.2f}",
-                    annotation_position="left"
-                )
-                
-                # Configure layout
-                fig.update_layout(
-                    title=f"Interactive Grid - {num_grids} Levels ({spacing_type.title()} Spacing)",
-                    xaxis_title="Time",
-                    yaxis_title="Price ($)",
-                    height=400,
-                    showlegend=False,
-                    yaxis=dict(
-                        range=[bottom_price * 0.95, top_price * 1.05],
-                        tickformat=".2f"
-                    ),
-                    xaxis=dict(
-                        range=[0, 100],  # Dummy time range
-                        showticklabels=False
-                    ),
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    paper_bgcolor="rgba(0,0,0,0)"
-                )
-                
-                # Generate statistics
-                price_range = top_price - bottom_price
-                avg_spacing = price_range / (num_grids - 1)
-                
-                if spacing_type == "geometric":
-                    ratio = (top_price / bottom_price) ** (1 / (num_grids - 1))
-                    spacing_info = f"Ratio: {ratio:.4f}"
-                else:
-                    spacing_info = f"Step: ${avg_spacing:.2f}"
-                
-                stats = dbc.Row([
-                    dbc.Col([
-                        html.Small([
-                            html.Strong("Range: "),
-                            f"${price_range:.2f}"
-                        ])
-                    ], width=3),
-                    dbc.Col([
-                        html.Small([
-                            html.Strong("Avg Spacing: "),
-                            f"${avg_spacing:.2f}"
-                        ])
-                    ], width=3),
-                    dbc.Col([
-                        html.Small([
-                            html.Strong("Spacing Info: "),
-                            spacing_info
-                        ])
-                    ], width=3),
-                    dbc.Col([
-                        html.Small([
-                            html.Strong("Mid Price: "),
-                            f"${mid_price:.2f}"
-                        ])
-                    ], width=3)
-                ], className="text-muted")
-                
-                return fig, stats
+                return _build_interactive_grid(num_grids, bottom_price, top_price, spacing_type,
+                                               chart_uirevision(config_data))
                 
             except Exception as e:
                 logger.error(f"Error updating interactive grid: {e}")
@@ -246,35 +250,43 @@ class InteractiveCallbacks:
         def sync_interactive_grid_to_config(num_grids, bottom_price, top_price, spacing_type, current_config):
             """Sync interactive grid changes back to main configuration."""
             try:
-                if not current_config:
-                    return current_config
+                if not current_config or not all([num_grids, bottom_price, top_price, spacing_type]):
+                    return dash.no_update
                 
-                # Update grid strategy configuration
-                if all([num_grids, bottom_price, top_price, spacing_type]):
-                    current_config["grid_strategy"]["num_grids"] = num_grids
-                    current_config["grid_strategy"]["bottom_price"] = bottom_price
-                    current_config["grid_strategy"]["top_price"] = top_price
-                    current_config["grid_strategy"]["spacing_type"] = spacing_type
+                # Leave config-store untouched when nothing changed, so its subscribers don't re-run
+                grid_values = {
+                    "num_grids": num_grids,
+                    "bottom_price": bottom_price,
+                    "top_price": top_price,
+                    "spacing_type": spacing_type
+                }
+                grid_strategy = current_config.get("grid_strategy", {})
+                if all(grid_strategy.get(key) == value for key, value in grid_values.items()):
+                    return dash.no_update
                 
-                return current_config
+                # Update only the grid strategy fields instead of sending the whole config back
+                patched_config = Patch()
+                for key, value in grid_values.items():
+                    patched_config["grid_strategy"][key] = value
+                return patched_config
                 
             except Exception as e:
                 logger.error(f"Error syncing interactive grid to config: {e}")
-                return current_config
+                return dash.no_update
         
         @self.app.callback(
             Output('toast-container', 'children', allow_duplicate=True),
             [Input('refresh-grid-btn', 'n_clicks')],
-            [State('toast-container', 'children'),
-             State('config-store', 'data')],
+            [State('config-store', 'data')],
             prevent_initial_call=True
         )
-        def handle_grid_refresh(n_clicks, current_toasts, config_data):
+        def handle_grid_refresh(n_clicks, config_data):
             """Handle grid refresh button click with user feedback."""
             if not n_clicks:
-                return current_toasts or []
+                return dash.no_update
             
-            toasts = current_toasts or []
+            # Append the toast client-side instead of round-tripping the existing ones
+            toasts = Patch()
             
             try:
                 # Add success toast
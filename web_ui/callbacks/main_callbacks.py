@@ -11,13 +11,53 @@ from typing import Dict, Any
 
 import dash
 from dash import Input, Output, State, ctx
+from dash.exceptions import PreventUpdate
 from web_ui.price_service import price_service
 from web_ui.components.visualizations import VisualizationComponents
 from web_ui.components.interactive_grid import interactive_grid
-from config.config_validator import ConfigValidator
 
 logger = logging.getLogger(__name__)
 
+# Per-section stores written by the form callbacks, mapped to their config section
+CONFIG_SECTION_STORES = {
+    'exchange-config-store': 'exchange',
+    'pair-config-store': 'pair',
+    'grid-config-store': 'grid_strategy',
+    'risk-config-store': 'risk_management',
+    'trading-config-store': 'trading_settings'
+}
+
+# Visualization tabs rendered from market-data-store
+MARKET_DATA_TABS = frozenset({"chart-tab", "realtime-tab"})
+
+# Formats the live price badge in the browser from the live-price-store payload
+LIVE_PRICE_BADGE_JS = """
+function(data) {
+    if (!data || data.status === 'idle') {
+        return ['Live Price: $--', 'secondary'];
+    }
+    if (data.status === 'ok') {
+        const price = data.price.toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2});
+        return ['Live Price: $' + price + ' (' + data.pair + ')', 'success'];
+    }
+    if (data.status === 'unavailable') {
+        return ['Live Price: Unable to fetch', 'warning'];
+    }
+    return ['Live Price: Error', 'danger'];
+}
+"""
+
+
+def _merge_section(current: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge section updates into the current section values."""
+    merged = dict(current)
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_section(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
 
 class MainCallbacks:
     """Class containing all main callback functions."""
@@ -38,6 +78,10 @@ class MainCallbacks:
         )
         def update_visualization(active_tab, config_data, market_data):
             """Update visualization based on active tab and configuration."""
+            # Market data refreshes only matter to the tabs that display it
+            if ctx.triggered_id == 'market-data-store' and active_tab not in MARKET_DATA_TABS:
+                raise PreventUpdate
+            
             if active_tab == "grid-tab":
                 return VisualizationComponents.create_grid_visualization(config_data)
             elif active_tab == "interactive-tab":
@@ -51,121 +95,204 @@ class MainCallbacks:
             return "Select a tab to view visualization"
         
         @self.app.callback(
-            Output('config-store', 'data'),
+            Output('exchange-config-store', 'data'),
             [Input('exchange-select', 'value'),
              Input('trading-mode-select', 'value'),
-             Input('trading-fee-input', 'value'),
-             Input('base-currency-input', 'value'),
-             Input('quote-currency-input', 'value'),
-             Input('strategy-type-select', 'value'),
+             Input('trading-fee-input', 'value')]
+        )
+        def update_exchange_config(exchange, trading_mode, trading_fee):
+            """Update the exchange section of the configuration."""
+            return {
+                "name": exchange or "coinbase",
+                "trading_mode": trading_mode or "backtest",
+                "trading_fee": (trading_fee or 0.5) / 100
+            }
+        
+        @self.app.callback(
+            Output('pair-config-store', 'data'),
+            [Input('base-currency-input', 'value'),
+             Input('quote-currency-input', 'value')]
+        )
+        def update_pair_config(base_currency, quote_currency):
+            """Update the trading pair section of the configuration."""
+            return {
+                "base_currency": (base_currency or "BTC").upper(),
+                "quote_currency": (quote_currency or "USDT").upper()
+            }
+        
+        @self.app.callback(
+            Output('grid-config-store', 'data'),
+            [Input('strategy-type-select', 'value'),
              Input('spacing-type-select', 'value'),
              Input('num-grids-input', 'value'),
              Input('bottom-price-input', 'value'),
-             Input('top-price-input', 'value'),
-             Input('take-profit-enabled', 'value'),
+             Input('top-price-input', 'value')]
+        )
+        def update_grid_config(strategy_type, spacing_type, num_grids, bottom_price, top_price):
+            """Update the grid strategy section of the configuration."""
+            return {
+                "type": strategy_type or "simple_grid",
+                "spacing": spacing_type or "arithmetic",
+                "num_grids": num_grids or 10,
+                "range": {
+                    "bottom": bottom_price or 90000,
+                    "top": top_price or 100000
+                }
+            }
+        
+        @self.app.callback(
+            Output('risk-config-store', 'data'),
+            [Input('take-profit-enabled', 'value'),
              Input('take-profit-threshold', 'value'),
              Input('stop-loss-enabled', 'value'),
-             Input('stop-loss-threshold', 'value'),
-             Input('timeframe-select', 'value'),
+             Input('stop-loss-threshold', 'value')]
+        )
+        def update_risk_config(tp_enabled, tp_threshold, sl_enabled, sl_threshold):
+            """Update the risk management section of the configuration."""
+            return {
+                "take_profit": {
+                    "enabled": "enabled" in (tp_enabled or []),
+                    "threshold": tp_threshold or 0
+                },
+                "stop_loss": {
+                    "enabled": "enabled" in (sl_enabled or []),
+                    "threshold": sl_threshold or 0
+                }
+            }
+        
+        @self.app.callback(
+            Output('trading-config-store', 'data'),
+            [Input('timeframe-select', 'value'),
              Input('initial-balance-input', 'value'),
              Input('start-date-input', 'value'),
-             Input('end-date-input', 'value')],
-            [State('config-store', 'data')]
+             Input('end-date-input', 'value')]
         )
-        def update_config(exchange, trading_mode, trading_fee, base_currency, quote_currency,
-                         strategy_type, spacing_type, num_grids, bottom_price, top_price,
-                         tp_enabled, tp_threshold, sl_enabled, sl_threshold,
-                         timeframe, initial_balance, start_date, end_date, current_config):
-            """Update configuration based on form inputs."""
+        def update_trading_config(timeframe, initial_balance, start_date, end_date):
+            """Update the trading settings section of the configuration."""
+            period = {}
+            if start_date:
+                period["start_date"] = start_date + "Z"
+            if end_date:
+                period["end_date"] = end_date + "Z"
+            
+            return {
+                "timeframe": timeframe or "1h",
+                "initial_balance": initial_balance or 10000,
+                "period": period
+            }
+        
+        @self.app.callback(
+            Output('config-store', 'data'),
+            [Input(store_id, 'data') for store_id in CONFIG_SECTION_STORES],
+            [State('config-store', 'data')],
+            prevent_initial_call=True
+        )
+        def combine_config(*args):
+            """Merge the section stores into the configuration, touching only the section that changed."""
+            *sections, current_config = args
             
             if not current_config:
                 # Load default config if none exists
                 from web_ui.app import GridBotUI
-                current_config = GridBotUI()._load_default_config()
-            
-            # Update configuration
-            current_config["exchange"]["name"] = exchange or "coinbase"
-            current_config["exchange"]["trading_mode"] = trading_mode or "backtest"
-            current_config["exchange"]["trading_fee"] = (trading_fee or 0.5) / 100
-            
-            current_config["pair"]["base_currency"] = (base_currency or "BTC").upper()
-            current_config["pair"]["quote_currency"] = (quote_currency or "USDT").upper()
+                new_config = GridBotUI._load_default_config()
+            else:
+                new_config = dict(current_config)
             
-            current_config["grid_strategy"]["type"] = strategy_type or "simple_grid"
-            current_config["grid_strategy"]["spacing"] = spacing_type or "arithmetic"
-            current_config["grid_strategy"]["num_grids"] = num_grids or 10
-            current_config["grid_strategy"]["range"]["bottom"] = bottom_price or 90000
-            current_config["grid_strategy"]["range"]["top"] = top_price or 100000
+            section_data = dict(zip(CONFIG_SECTION_STORES, sections))
+            triggered_id = ctx.triggered_id
+            store_ids = [triggered_id] if triggered_id in section_data else CONFIG_SECTION_STORES
             
-            current_config["risk_management"]["take_profit"]["enabled"] = "enabled" in (tp_enabled or [])
-            current_config["risk_management"]["take_profit"]["threshold"] = tp_threshold or 0
-            current_config["risk_management"]["stop_loss"]["enabled"] = "enabled" in (sl_enabled or [])
-            current_config["risk_management"]["stop_loss"]["threshold"] = sl_threshold or 0
+            for store_id in store_ids:
+                if section_data[store_id]:
+                    section = CONFIG_SECTION_STORES[store_id]
+                    new_config[section] = _merge_section(new_config.get(section, {}), section_data[store_id])
             
-            current_config["trading_settings"]["timeframe"] = timeframe or "1h"
-            current_config["trading_settings"]["initial_balance"] = initial_balance or 10000
-            
-            if start_date:
-                current_config["trading_settings"]["period"]["start_date"] = start_date + "Z"
-            if end_date:
-                current_config["trading_settings"]["period"]["end_date"] = end_date + "Z"
+            # Skip the store write (and the visualization refresh it triggers) when nothing changed
+            if new_config == current_config:
+                raise PreventUpdate
             
-            return current_config
+            return new_config
         
         @self.app.callback(
-            [Output('live-price-badge', 'children'),
-             Output('live-price-badge', 'color')],
-            [Input('price-update-interval', 'n_intervals'),
-             Input('base-currency-input', 'value'),
+            Output('symbol-store', 'data'),
+            [Input('base-currency-input', 'value'),
              Input('quote-currency-input', 'value'),
              Input('exchange-select', 'value')]
         )
-        def update_live_price(n_intervals, base_currency, quote_currency, exchange):
-            """Update live price badge with real data."""
+        def update_symbol(base_currency, quote_currency, exchange):
+            """Normalize the selected market once per change for the price and market data callbacks."""
+            if not base_currency or not quote_currency or not exchange:
+                return None
+            
+            base_currency = base_currency.upper()
+            quote_currency = quote_currency.upper()
+            return {
+                "exchange": exchange,
+                "base_currency": base_currency,
+                "quote_currency": quote_currency,
+                "symbol": f"{base_currency}/{quote_currency}"
+            }
+        
+        @self.app.callback(
+            Output('live-price-store', 'data'),
+            [Input('price-update-interval', 'n_intervals'),
+             Input('symbol-store', 'data')]
+        )
+        def update_live_price(n_intervals, symbol_data):
+            """Fetch the live price; the badge itself is rendered client-side."""
             try:
-                if not base_currency or not quote_currency or not exchange:
-                    return "Live Price: $--", "secondary"
+                if not symbol_data:
+                    return {"status": "idle"}
 
                 # Get current price using synchronous wrapper with timeout
-                price = price_service.get_current_price_sync(exchange, base_currency, quote_currency)
+                price = price_service.get_current_price_sync(
+                    symbol_data["exchange"], symbol_data["base_currency"], symbol_data["quote_currency"]
+                )
 
                 if price:
-                    pair = f"{base_currency}/{quote_currency}"
-                    return f"Live Price: ${price:,.2f} ({pair})", "success"
+                    return {"status": "ok", "price": price, "pair": symbol_data["symbol"]}
                 else:
-                    return f"Live Price: Unable to fetch", "warning"
+                    return {"status": "unavailable"}
 
             except Exception as e:
                 logger.error(f"Error fetching live price: {e}")
-                return f"Live Price: Error", "danger"
+                return {"status": "error"}
+        
+        self.app.clientside_callback(
+            LIVE_PRICE_BADGE_JS,
+            [Output('live-price-badge', 'children'),
+             Output('live-price-badge', 'color')],
+            [Input('live-price-store', 'data')]
+        )
         
         @self.app.callback(
             Output('market-data-store', 'data'),
             [Input('chart-update-interval', 'n_intervals'),
-             Input('base-currency-input', 'value'),
-             Input('quote-currency-input', 'value'),
-             Input('exchange-select', 'value'),
+             Input('symbol-store', 'data'),
              Input('timeframe-select', 'value')]
         )
-        def update_market_data(n_intervals, base_currency, quote_currency, exchange, timeframe):
+        def update_market_data(n_intervals, symbol_data, timeframe):
             """Update market data for charts."""
-            if not base_currency or not quote_currency or not exchange:
+            if not symbol_data:
                 return {}
             
+            exchange = symbol_data["exchange"]
+            base_currency = symbol_data["base_currency"]
+            quote_currency = symbol_data["quote_currency"]
+            
             try:
-                # Get historical data
-                df = price_service.get_historical_data_sync(
-                    exchange, base_currency, quote_currency, timeframe, limit=168
-                )
+                # Keep the frame server-side; the store carries its cache key and what
+                # another worker needs to load it again
+                key, df = price_service.load_market_data(exchange, base_currency, quote_currency, timeframe)
                 
-                if df is not None and not df.empty:
-                    # Convert DataFrame to dict for storage
+                if df is not None:
                     market_data = {
-                        'symbol': f"{base_currency}/{quote_currency}",
+                        'key': key,
+                        'symbol': symbol_data["symbol"],
                         'exchange': exchange,
+                        'base_currency': base_currency,
+                        'quote_currency': quote_currency,
                         'timeframe': timeframe,
-                        'data': df.to_dict('records'),
-                        'timestamps': df.index.strftime('%Y-%m-%d %H:%M:%S').tolist(),
                         'last_update': datetime.now().isoformat()
                     }
                     return market_data
@@ -13,7 +13,7 @@ from web_ui.components.help_system import help_system
 # from web_ui.components.enhanced_ui import EnhancedUIComponents  # Commented out for now
 
 # Supported exchanges with additional metadata
-SUPPORTED_EXCHANGES = [
+SUPPORTED_EXCHANGES = (
     {"value": "coinbase", "label": "Coinbase", "fee": 0.5, "recommended": True, "description": "Beginner-friendly, high liquidity"},
     {"value": "kraken", "label": "Kraken", "fee": 0.26, "recommended": True, "description": "Low fees, advanced features"},
     {"value": "bitfinex", "label": "Bitfinex", "fee": 0.2, "recommended": False, "description": "Professional trading platform"},
@@ -25,7 +25,40 @@ SUPPORTED_EXCHANGES = [
     {"value": "poloniex", "label": "Poloniex", "fee": 0.25, "recommended": False, "description": "Wide variety of altcoins"},
     {"value": "gate", "label": "Gate.io", "fee": 0.2, "recommended": False, "description": "Comprehensive trading platform"},
     {"value": "kucoin", "label": "KuCoin", "fee": 0.1, "recommended": False, "description": "Low fees, many trading pairs"}
-]
+)
+
+# Exchange dropdown options, built once at import time
+EXCHANGE_OPTIONS = tuple(
+    {
+        "label": html.Div([
+            html.Div([
+                html.Strong(ex["label"]),
+                dbc.Badge("Recommended", color="success", className="ms-2 small") if ex["recommended"] else None
+            ], className="d-flex align-items-center justify-content-between"),
+            html.Small(f"{ex['description']} • Fee: {ex['fee']}%", className="text-muted")
+        ]),
+        "value": ex["value"]
+    } for ex in SUPPORTED_EXCHANGES
+)
+
+TIMEFRAME_DESCRIPTIONS = {
+    "1m": "Very short-term, high frequency",
+    "5m": "Short-term scalping",
+    "15m": "Short-term trading",
+    "30m": "Medium-term intraday",
+    "1h": "Hourly analysis (recommended)",
+    "4h": "Medium-term swing trading",
+    "6h": "Longer-term positioning",
+    "12h": "Half-daily analysis",
+    "1d": "Daily trend following",
+    "1w": "Weekly trend analysis"
+}
+
+# Timeframe dropdown options, built once at import time
+TIMEFRAME_OPTIONS = tuple(
+    {"label": f"📊 {tf} - {TIMEFRAME_DESCRIPTIONS.get(tf, 'Custom timeframe')}", "value": tf}
+    for tf in TIMEFRAME_MAPPINGS
+)
 
 # Popular trading pairs
 POPULAR_PAIRS = [
@@ -105,18 +138,7 @@ class ConfigForms:
 
                         dcc.Dropdown(
                             id="exchange-select",
-                            options=[
-                                {
-                                    "label": html.Div([
-                                        html.Div([
-                                            html.Strong(ex["label"]),
-                                            dbc.Badge("Recommended", color="success", className="ms-2 small") if ex["recommended"] else None
-                                        ], className="d-flex align-items-center justify-content-between"),
-                                        html.Small(f"{ex['description']} • Fee: {ex['fee']}%", className="text-muted")
-                                    ]),
-                                    "value": ex["value"]
-                                } for ex in SUPPORTED_EXCHANGES
-                            ],
+                            options=EXCHANGE_OPTIONS,
                             value=self.current_config["exchange"]["name"],
                             clearable=False,
                             className="mb-3"
@@ -152,6 +174,7 @@ class ConfigForms:
                                 dbc.InputGroup([
                                     dbc.Input(
                                         id="trading-fee-input",
+                                        debounce=True,
                                         type="number",
                                         value=self.current_config["exchange"]["trading_fee"] * 100,
                                         min=0,
@@ -204,6 +227,7 @@ class ConfigForms:
                                 dbc.Label("Base Currency", className="form-label fw-semibold"),
                                 dbc.Input(
                                     id="base-currency-input",
+                                    debounce=True,
                                     type="text",
                                     value=self.current_config["pair"]["base_currency"],
                                     placeholder="BTC",
@@ -219,6 +243,7 @@ class ConfigForms:
                                 dbc.Label("Quote Currency", className="form-label fw-semibold"),
                                 dbc.Input(
                                     id="quote-currency-input",
+                                    debounce=True,
                                     type="text",
                                     value=self.current_config["pair"]["quote_currency"],
                                     placeholder="USDT",
@@ -341,6 +366,7 @@ class ConfigForms:
                                 dbc.Label("Number of Grids", className="form-label fw-semibold"),
                                 dbc.Input(
                                     id="num-grids-input",
+                                    debounce=True,
                                     type="number",
                                     value=self.current_config["grid_strategy"]["num_grids"],
                                     min=3,
@@ -365,6 +391,7 @@ class ConfigForms:
                                         dbc.InputGroupText("$"),
                                         dbc.Input(
                                             id="bottom-price-input",
+                                            debounce=True,
                                             type="number",
                                             value=self.current_config["grid_strategy"]["range"]["bottom"],
                                             min=0.01,
@@ -384,6 +411,7 @@ class ConfigForms:
                                         dbc.InputGroupText("$"),
                                         dbc.Input(
                                             id="top-price-input",
+                                            debounce=True,
                                             type="number",
                                             value=self.current_config["grid_strategy"]["range"]["top"],
                                             min=0.01,
@@ -454,6 +482,7 @@ class ConfigForms:
                                             dbc.InputGroupText("$"),
                                             dbc.Input(
                                                 id="take-profit-threshold",
+                                                debounce=True,
                                                 type="number",
                                                 value=self.current_config["risk_management"]["take_profit"]["threshold"],
                                                 min=0,
@@ -488,6 +517,7 @@ class ConfigForms:
                                             dbc.InputGroupText("$"),
                                             dbc.Input(
                                                 id="stop-loss-threshold",
+                                                debounce=True,
                                                 type="number",
                                                 value=self.current_config["risk_management"]["stop_loss"]["threshold"],
                                                 min=0,
@@ -524,10 +554,7 @@ class ConfigForms:
                                 dbc.Label("Chart Timeframe", className="form-label fw-semibold"),
                                 dcc.Dropdown(
                                     id="timeframe-select",
-                                    options=[
-                                        {"label": f"📊 {tf} - {self._get_timeframe_description(tf)}", "value": tf}
-                                        for tf in TIMEFRAME_MAPPINGS.keys()
-                                    ],
+                                    options=TIMEFRAME_OPTIONS,
                                     value=self.current_config["trading_settings"]["timeframe"],
                                     clearable=False,
                                     className="mb-2"
@@ -544,6 +571,7 @@ class ConfigForms:
                                     dbc.InputGroupText("$"),
                                     dbc.Input(
                                         id="initial-balance-input",
+                                        debounce=True,
                                         type="number",
                                         value=self.current_config["trading_settings"]["initial_balance"],
                                         min=100,
@@ -567,6 +595,7 @@ class ConfigForms:
                                     dbc.Label("Start Date", className="form-label fw-semibold"),
                                     dbc.Input(
                                         id="start-date-input",
+                                        debounce=True,
                                         type="datetime-local",
                                         value=self.current_config["trading_settings"]["period"]["start_date"].replace("Z", ""),
                                         className="mb-2"
@@ -581,6 +610,7 @@ class ConfigForms:
                                     dbc.Label("End Date", className="form-label fw-semibold"),
                                     dbc.Input(
                                         id="end-date-input",
+                                        debounce=True,
                                         type="datetime-local",
                                         value=self.current_config["trading_settings"]["period"]["end_date"].replace("Z", ""),
                                         className="mb-2"
@@ -608,19 +638,7 @@ class ConfigForms:
 
     def _get_timeframe_description(self, timeframe: str) -> str:
         """Get description for timeframe."""
-        descriptions = {
-            "1m": "Very short-term, high frequency",
-            "5m": "Short-term scalping",
-            "15m": "Short-term trading",
-            "30m": "Medium-term intraday",
-            "1h": "Hourly analysis (recommended)",
-            "4h": "Medium-term swing trading",
-            "6h": "Longer-term positioning",
-            "12h": "Half-daily analysis",
-            "1d": "Daily trend following",
-            "1w": "Weekly trend analysis"
-        }
-        return descriptions.get(timeframe, "Custom timeframe")
+        return TIMEFRAME_DESCRIPTIONS.get(timeframe, "Custom timeframe")
 
     def create_configuration_summary(self):
         """Create a configuration summary card."""
@@ -11,6 +11,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from typing import Dict, Any, List, Optional
 import logging
+from web_ui.utils.plotting import format_price_labels, grid_label_trace, grid_line_trace, ohlc_traces
 
 logger = logging.getLogger(__name__)
 
@@ -179,7 +180,8 @@ class EnhancedUIComponents:
         data: Dict[str, Any],
         grid_levels: List[float] = None,
         height: int = 500,
-        show_volume: bool = True
+        show_volume: bool = True,
+        uirevision: Optional[str] = None
     ):
         """
         Create an interactive price chart with grid overlay and enhanced features.
@@ -189,6 +191,8 @@ class EnhancedUIComponents:
             grid_levels: List of grid price levels to overlay
             height: Chart height in pixels
             show_volume: Whether to show volume subplot
+            uirevision: Key that keeps zoom/pan across updates while unchanged,
+                "exchange:pair:timeframe" as built by chart_uirevision
         """
         if not data or 'data' not in data:
             return html.Div([
@@ -215,33 +219,38 @@ class EnhancedUIComponents:
             row_heights=[0.7, 0.3] if show_volume else [1.0]
         )
         
-        # Add candlestick chart
+        # Add OHLC bars as WebGL traces rather than an SVG candlestick per bar
+        for trace in ohlc_traces(df):
+            fig.add_trace(trace, row=1, col=1)
+        
+        # Add a close line carrying the hover values
         fig.add_trace(
-            go.Candlestick(
+            go.Scattergl(
                 x=df.index,
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
+                y=df['close'],
+                mode="lines",
                 name="Price",
-                increasing_line_color='#10b981',
-                decreasing_line_color='#ef4444'
+                line=dict(color="rgba(100, 116, 139, 0.4)", width=1)
             ),
             row=1, col=1
         )
         
-        # Add grid levels if provided
+        # Add grid levels if provided, as one trace per color
         if grid_levels:
-            for i, level in enumerate(grid_levels):
-                fig.add_hline(
-                    y=level,
-                    line_dash="dot",
-                    line_color="#3b82f6" if i % 2 == 0 else "#f59e0b",
-                    line_width=1,
-                    annotation_text=f"${level:.2f}",
-                    annotation_position="right",
-                    row=1, col=1
-                )
+            # Epoch milliseconds, which the date axis accepts alongside the NaN gaps
+            timestamps_ms = df.index.as_unit('ms').asi8
+            x_range = (float(timestamps_ms[0]), float(timestamps_ms[-1]))
+            fig.add_trace(grid_line_trace(grid_levels[::2], "#3b82f6", "Grid", x_range=x_range, dash="dot"), row=1, col=1)
+            fig.add_trace(grid_line_trace(grid_levels[1::2], "#f59e0b", "Grid", x_range=x_range, dash="dot"), row=1, col=1)
+            fig.add_trace(
+                grid_label_trace(
+                    grid_levels,
+                    format_price_labels(grid_levels, "${:.2f}"),
+                    ["#3b82f6" if i % 2 == 0 else "#f59e0b" for i in range(len(grid_levels))],
+                    x=x_range[1]
+                ),
+                row=1, col=1
+            )
         
         # Add volume if requested
         if show_volume and 'volume' in df.columns:
@@ -263,11 +272,12 @@ class EnhancedUIComponents:
             xaxis_rangeslider_visible=False,
             template="plotly_white",
             margin=dict(l=0, r=0, t=30, b=0),
-            hovermode='x unified'
+            hovermode='x unified',
+            uirevision=uirevision
         )
         
         # Update axes
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
+        fig.update_xaxes(type="date", showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
         fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
         
         return dcc.Graph(
@@ -5,6 +5,7 @@ Provides interactive grid manipulation, real-time updates, and enhanced
 visualization features for better user experience.
 """
 
+import functools
 import dash_bootstrap_components as dbc
 from dash import html, dcc, Input, Output, State, callback
 import plotly.graph_objects as go
@@ -13,6 +14,8 @@ import numpy as np
 from typing import Dict, Any, List, Tuple, Optional
 import logging
 from web_ui.components.notifications import notification_system
+from web_ui.price_service import price_service
+from web_ui.utils.plotting import chart_uirevision, format_price_labels
 
 logger = logging.getLogger(__name__)
 
@@ -47,15 +50,20 @@ class InteractiveGridComponents:
             # Create interactive plot
             fig = go.Figure()
             
-            # Add grid lines
-            for i, level in enumerate(grid_levels):
-                fig.add_hline(
-                    y=level,
-                    line_dash="dash",
-                    line_color="blue" if i % 2 == 0 else "red",
-                    annotation_text=f"${level:.2f}",
-                    annotation_position="right"
-                )
+            # Add grid lines and their labels in one layout update rather than an add_hline per level
+            line_colors = ["blue" if i % 2 == 0 else "red" for i in range(len(grid_levels))]
+            fig.update_layout(
+                shapes=[
+                    dict(type="line", xref="paper", x0=0, x1=1, yref="y", y0=level, y1=level,
+                         line=dict(color=color, dash="dash"))
+                    for level, color in zip(grid_levels, line_colors)
+                ],
+                annotations=[
+                    dict(xref="paper", x=1, yref="y", y=level, text=label, showarrow=False,
+                         xanchor="right", yanchor="bottom")
+                    for level, label in zip(grid_levels, format_price_labels(grid_levels, "${:.2f}"))
+                ]
+            )
             
             # Add price range indicators
             fig.add_hrect(
@@ -75,7 +83,9 @@ class InteractiveGridComponents:
                 height=500,
                 showlegend=False,
                 dragmode="pan",
-                hovermode="y unified"
+                hovermode="y unified",
+                # Keep the user's zoom until the exchange, pair or timeframe changes
+                uirevision=chart_uirevision(config_data)
             )
             
             # Add range selector
@@ -111,6 +121,7 @@ class InteractiveGridComponents:
                             dbc.InputGroup([
                                 dbc.Input(
                                     id="grid-levels-input",
+                                    debounce=True,
                                     type="number",
                                     value=num_grids,
                                     min=3,
@@ -129,6 +140,7 @@ class InteractiveGridComponents:
                             dbc.Label("Bottom Price", size="sm"),
                             dbc.Input(
                                 id="bottom-price-interactive",
+                                debounce=True,
                                 type="number",
                                 value=bottom_price,
                                 step=0.01,
@@ -139,6 +151,7 @@ class InteractiveGridComponents:
                             dbc.Label("Top Price", size="sm"),
                             dbc.Input(
                                 id="top-price-interactive",
+                                debounce=True,
                                 type="number",
                                 value=top_price,
                                 step=0.01,
@@ -209,11 +222,11 @@ class InteractiveGridComponents:
             base_currency = config_data["pair"]["base_currency"]
             quote_currency = config_data["pair"]["quote_currency"]
             
-            # Get current price from market data
+            # Get current price from the server-side market data cache
             current_price = None
-            if market_data and 'data' in market_data and market_data['data']:
-                latest_data = market_data['data'][-1]
-                current_price = latest_data.get('close', None)
+            if market_data:
+                df = price_service.get_market_data(market_data)
+                current_price = float(df['close'].iloc[-1]) if df is not None and not df.empty else None
             
             # Generate grid levels
             grid_config = config_data.get("grid_strategy", {})
@@ -277,25 +290,31 @@ class InteractiveGridComponents:
             )
     
     @staticmethod
-    def _generate_grid_levels(num_grids: int, bottom_price: float, top_price: float, spacing_type: str) -> List[float]:
-        """Generate grid levels based on configuration."""
+    @functools.lru_cache(maxsize=64)
+    def _generate_grid_levels(num_grids: int, bottom_price: float, top_price: float,
+                              spacing_type: str) -> Tuple[float, ...]:
+        """Generate grid levels based on configuration, cached as an immutable tuple."""
         if spacing_type == "geometric":
-            # Geometric spacing
-            ratio = (top_price / bottom_price) ** (1 / (num_grids - 1))
-            levels = [bottom_price * (ratio ** i) for i in range(num_grids)]
+            levels = np.geomspace(bottom_price, top_price, num_grids)
         else:
-            # Arithmetic spacing
-            step = (top_price - bottom_price) / (num_grids - 1)
-            levels = [bottom_price + (step * i) for i in range(num_grids)]
+            levels = np.linspace(bottom_price, top_price, num_grids)
         
-        return levels
+        return tuple(levels.tolist())
     
     @staticmethod
     def _create_grid_level_indicators(grid_levels: List[float], current_price: Optional[float]) -> List:
         """Create visual indicators for grid levels."""
         indicators = []
         
-        for i, level in enumerate(grid_levels):
+        # Format every price and distance label up front instead of per row
+        price_labels = format_price_labels(grid_levels, "${:.2f}")
+        if current_price:
+            distances = (np.asarray(grid_levels, dtype=float) - current_price) / current_price * 100
+            distance_labels = format_price_labels(distances, "{:+.1f}%")
+        else:
+            distance_labels = ["N/A"] * len(grid_levels)
+        
+        for level, price_label, distance_label in zip(grid_levels, price_labels, distance_labels):
             # Determine if level is above or below current price
             if current_price:
                 if level > current_price:
@@ -319,13 +338,10 @@ class InteractiveGridComponents:
                     ], color=color, className="badge-sm")
                 ], width=3),
                 dbc.Col([
-                    html.Span(f"${level:.2f}", className="small")
+                    html.Span(price_label, className="small")
                 ], width=6),
                 dbc.Col([
-                    html.Span(
-                        f"{((level - current_price) / current_price * 100):+.1f}%" if current_price else "N/A",
-                        className="small text-muted"
-                    )
+                    html.Span(distance_label, className="small text-muted")
                 ], width=3)
             ], className="mb-1")
             
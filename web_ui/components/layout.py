@@ -210,7 +210,16 @@ class LayoutComponents:
             
             # Hidden components for data storage
             dcc.Store(id='config-store', data=self.current_config),
+            dcc.Store(id='exchange-config-store'),
+            dcc.Store(id='pair-config-store'),
+            dcc.Store(id='grid-config-store'),
+            dcc.Store(id='risk-config-store'),
+            dcc.Store(id='trading-config-store'),
+            dcc.Store(id='symbol-store'),
+            dcc.Store(id='export-cache'),
+            dcc.Store(id='last-export-store'),  # per-client fingerprint of the last export
             dcc.Store(id='market-data-store', data={}),
+            dcc.Store(id='live-price-store'),
             dcc.Interval(id='price-update-interval', interval=30000, n_intervals=0),  # 30 seconds
             dcc.Interval(id='chart-update-interval', interval=60000, n_intervals=0),  # 1 minute for charts
 
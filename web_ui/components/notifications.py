@@ -167,7 +167,7 @@ class NotificationSystem:
         spinner = dbc.Spinner(
             color=color,
             size=size,
-            style=spinner_sizes.get(size, spinner_sizes["md"])
+            spinner_style=spinner_sizes.get(size, spinner_sizes["md"])
         )
         
         if text:
@@ -4,19 +4,28 @@ Visualization Components for Grid Trading Bot Web UI
 Contains all chart and visualization components.
 """
 
+import functools
 import logging
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from web_ui.price_service import price_service
-from web_ui.services.backtest_service import backtest_service
+from web_ui.components.enhanced_ui import EnhancedUIComponents
 from web_ui.components.notifications import notification_system
+from web_ui.utils.plotting import chart_uirevision, format_price_labels, grid_label_trace, grid_line_trace
 
 logger = logging.getLogger(__name__)
 
+# Backtest preview metric cards: (performance key, label, value format, text class)
+BACKTEST_METRICS = (
+    ("estimated_roi", "Expected ROI", "{:.1f}%", "text-success"),
+    ("estimated_trades", "Estimated Trades", "{}", "text-info"),
+    ("max_drawdown", "Max Drawdown", "{:.1f}%", "text-warning"),
+    ("sharpe_ratio", "Sharpe Ratio", "{:.2f}", "text-primary"),
+)
+
 
 class VisualizationComponents:
     """Class containing all visualization components."""
@@ -40,44 +49,6 @@ class VisualizationComponents:
             if num_grids < 3:
                 return dbc.Alert("Number of grids must be at least 3", color="danger")
 
-            # Calculate grid levels
-            if spacing_type == "arithmetic":
-                grid_levels = np.linspace(bottom, top, num_grids)
-            else:  # geometric
-                ratio = (top / bottom) ** (1 / (num_grids - 1))
-                grid_levels = [bottom * (ratio ** i) for i in range(num_grids)]
-
-            # Create enhanced visualization
-            fig = go.Figure()
-
-            # Add background gradient
-            fig.add_hrect(
-                y0=bottom, y1=top,
-                fillcolor="rgba(59, 130, 246, 0.1)",
-                layer="below",
-                line_width=0
-            )
-
-            # Add grid lines with enhanced styling
-            for i, level in enumerate(grid_levels):
-                is_buy_level = i < len(grid_levels) // 2
-                color = "#10b981" if is_buy_level else "#ef4444"  # Green for buy, red for sell
-                line_width = 2 if i == 0 or i == len(grid_levels) - 1 else 1
-
-                fig.add_hline(
-                    y=level,
-                    line_dash="solid" if i == 0 or i == len(grid_levels) - 1 else "dash",
-                    line_color=color,
-                    line_width=line_width,
-                    annotation_text=f"${level:,.2f} {'(BUY)' if is_buy_level else '(SELL)'}",
-                    annotation_position="right",
-                    annotation=dict(
-                        bgcolor=color,
-                        bordercolor=color,
-                        font=dict(color="white", size=10)
-                    )
-                )
-
             # Try to get real current price
             try:
                 exchange_name = config_data.get("exchange", {}).get("name", "coinbase")
@@ -87,123 +58,186 @@ class VisualizationComponents:
             except:
                 current_price = None
 
-            # Add current price indicator
             if not current_price:
                 current_price = (top + bottom) / 2  # Fallback to middle
 
-            fig.add_hline(
-                y=current_price,
-                line_color="#3b82f6",
-                line_width=4,
-                annotation_text=f"Current: ${current_price:,.2f}",
-                annotation_position="left",
-                annotation=dict(
-                    bgcolor="#3b82f6",
-                    bordercolor="#3b82f6",
-                    font=dict(color="white", size=12, family="monospace")
-                )
-            )
+            trading_fee = config_data.get("exchange", {}).get("trading_fee", 0.005)
 
-            # Enhanced styling
-            fig.update_layout(
-                title=dict(
-                    text="Grid Trading Strategy Visualization",
-                    font=dict(size=18, family="Inter"),
-                    x=0.5
-                ),
-                yaxis_title="Price (USD)",
-                height=500,
-                showlegend=False,
-                yaxis=dict(
-                    range=[bottom * 0.9, top * 1.1],
-                    tickformat="$,.2f",
-                    gridcolor="rgba(0,0,0,0.1)"
-                ),
-                xaxis=dict(visible=False),
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                margin=dict(l=80, r=80, t=60, b=40)
+            return VisualizationComponents._build_grid_visualization(
+                bottom, top, num_grids, spacing_type, current_price, trading_fee, chart_uirevision(config_data)
             )
 
-            # Calculate detailed statistics
-            price_range = top - bottom
-            grid_spacing = price_range / (num_grids - 1) if spacing_type == "arithmetic" else "Variable"
-            range_percentage = (price_range / current_price) * 100 if current_price else 0
-
-            # Calculate potential profit per grid
-            trading_fee = config_data.get("exchange", {}).get("trading_fee", 0.005)
-            if spacing_type == "arithmetic":
-                avg_spacing = grid_spacing
-                profit_per_grid = (avg_spacing / current_price - 2 * trading_fee) * 100 if current_price else 0
-            else:
-                avg_spacing = price_range / num_grids  # Approximation
-                profit_per_grid = (avg_spacing / current_price - 2 * trading_fee) * 100 if current_price else 0
-
-            # Enhanced summary cards
-            summary_cards = dbc.Row([
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.Div([
-                                html.I(className="fas fa-layer-group fa-2x text-primary mb-2"),
-                                html.H4(str(num_grids), className="mb-1"),
-                                html.P("Grid Levels", className="mb-0 text-muted small")
-                            ], className="text-center")
-                        ])
-                    ], className="h-100")
-                ], width=3),
-
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.Div([
-                                html.I(className="fas fa-arrows-alt-v fa-2x text-info mb-2"),
-                                html.H4(f"${price_range:,.0f}", className="mb-1"),
-                                html.P("Price Range", className="mb-0 text-muted small")
-                            ], className="text-center")
-                        ])
-                    ], className="h-100")
-                ], width=3)
-            ], className="g-3 mt-3")
-
-            return html.Div([
-                dcc.Graph(
-                    figure=fig,
-                    config={
-                        'displayModeBar': True,
-                        'displaylogo': False,
-                        'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d'],
-                        'toImageButtonOptions': {
-                            'format': 'png',
-                            'filename': 'grid_strategy_visualization',
-                            'height': 500,
-                            'width': 800,
-                            'scale': 2
-                        }
-                    }
-                ),
-                summary_cards
-            ])
-
         except Exception as e:
             logger.error(f"Error creating grid visualization: {e}")
             return dbc.Alert(f"Error creating grid visualization: {str(e)}", color="danger")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _grid_levels(bottom: float, top: float, num_grids: int, spacing_type: str) -> Tuple[float, ...]:
+        """Calculate the grid levels, cached as an immutable tuple."""
+        if spacing_type == "arithmetic":
+            levels = np.linspace(bottom, top, num_grids)
+        else:  # geometric
+            levels = np.geomspace(bottom, top, num_grids)
+        return tuple(levels.tolist())
+
+    @staticmethod
+    def _build_grid_visualization(bottom: float, top: float, num_grids: int, spacing_type: str,
+                                  current_price: float, trading_fee: float, uirevision: str):
+        """Build a fresh grid figure and summary cards from the cached grid levels."""
+        grid_levels = np.array(VisualizationComponents._grid_levels(bottom, top, num_grids, spacing_type))
+
+        # Create enhanced visualization
+        fig = go.Figure()
+
+        # Add background gradient
+        fig.add_hrect(
+            y0=bottom, y1=top,
+            fillcolor="rgba(59, 130, 246, 0.1)",
+            layer="below",
+            line_width=0
+        )
+
+        # Add grid lines as one WebGL trace per side instead of one shape per level
+        num_levels = len(grid_levels)
+        buy_levels = grid_levels[:num_levels // 2]
+        sell_levels = grid_levels[num_levels // 2:]
+        fig.add_trace(grid_line_trace(buy_levels, "#10b981", "Buy levels"))
+        fig.add_trace(grid_line_trace(sell_levels, "#ef4444", "Sell levels"))
+
+        # Emphasize the range bounds
+        fig.add_trace(go.Scattergl(
+            x=[0, 1, None, 0, 1],
+            y=[bottom, bottom, None, top, top],
+            mode="lines",
+            line=dict(color="#6b7280", width=2),
+            hoverinfo="skip"
+        ))
+
+        level_colors = ["#10b981"] * len(buy_levels) + ["#ef4444"] * len(sell_levels)
+        level_labels = format_price_labels(buy_levels, "${:,.2f} (BUY)") + format_price_labels(sell_levels, "${:,.2f} (SELL)")
+        fig.add_trace(grid_label_trace(grid_levels, level_labels, level_colors))
+
+        # Add current price indicator
+        fig.add_hline(
+            y=current_price,
+            line_color="#3b82f6",
+            line_width=4,
+            annotation_text=f"Current: ${current_price:,.2f}",
+            annotation_position="left",
+            annotation=dict(
+                bgcolor="#3b82f6",
+                bordercolor="#3b82f6",
+                font=dict(color="white", size=12, family="monospace")
+            )
+        )
+
+        # Enhanced styling
+        fig.update_layout(
+            title=dict(
+                text="Grid Trading Strategy Visualization",
+                font=dict(size=18, family="Inter"),
+                x=0.5
+            ),
+            yaxis_title="Price (USD)",
+            height=500,
+            showlegend=False,
+            yaxis=dict(
+                range=[bottom * 0.9, top * 1.1],
+                tickformat="$,.2f",
+                gridcolor="rgba(0,0,0,0.1)"
+            ),
+            xaxis=dict(visible=False, range=[0, 1]),
+            plot_bgcolor="white",
+            paper_bgcolor="white",
+            margin=dict(l=80, r=80, t=60, b=40),
+            # Keep the user's zoom until the exchange, pair or timeframe changes
+            uirevision=uirevision
+        )
+
+        # Calculate detailed statistics
+        price_range = top - bottom
+        grid_spacing = price_range / (num_grids - 1) if spacing_type == "arithmetic" else "Variable"
+        range_percentage = (price_range / current_price) * 100 if current_price else 0
+
+        # Calculate potential profit per grid
+        if spacing_type == "arithmetic":
+            avg_spacing = grid_spacing
+            profit_per_grid = (avg_spacing / current_price - 2 * trading_fee) * 100 if current_price else 0
+        else:
+            avg_spacing = price_range / num_grids  # Approximation
+            profit_per_grid = (avg_spacing / current_price - 2 * trading_fee) * 100 if current_price else 0
+
+        # Enhanced summary cards
+        summary_cards = dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.Div([
+                            html.I(className="fas fa-layer-group fa-2x text-primary mb-2"),
+                            html.H4(str(num_grids), className="mb-1"),
+                            html.P("Grid Levels", className="mb-0 text-muted small")
+                        ], className="text-center")
+                    ])
+                ], className="h-100")
+            ], width=3),
+
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.Div([
+                            html.I(className="fas fa-arrows-alt-v fa-2x text-info mb-2"),
+                            html.H4(f"${price_range:,.0f}", className="mb-1"),
+                            html.P("Price Range", className="mb-0 text-muted small")
+                        ], className="text-center")
+                    ])
+                ], className="h-100")
+            ], width=3)
+        ], className="g-3 mt-3")
+
+        return html.Div([
+            dcc.Graph(
+                figure=fig,
+                config={
+                    'displayModeBar': True,
+                    'displaylogo': False,
+                    'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d'],
+                    'toImageButtonOptions': {
+                        'format': 'png',
+                        'filename': 'grid_strategy_visualization',
+                        'height': 500,
+                        'width': 800,
+                        'scale': 2
+                    }
+                }
+            ),
+            summary_cards
+        ])
+
     @staticmethod
     def create_price_chart(config_data: Dict[str, Any], market_data: Dict[str, Any]):
-        """Create enhanced price chart with grid overlay."""
+        """Create the price chart of the fetched market data with the grid levels overlaid."""
         try:
             if not config_data:
                 return dbc.Alert("No configuration data available", color="warning")
 
-            # Simple price chart for now
-            return dbc.Card([
-                dbc.CardBody([
-                    html.H6("Price Chart with Grid Overlay", className="mb-3"),
-                    html.P("Price chart functionality will be implemented here."),
-                    dbc.Alert("Historical data integration coming soon!", color="info")
-                ])
-            ])
+            df = price_service.get_market_data(market_data)
+            if df is None:
+                return EnhancedUIComponents.create_interactive_price_chart(None)
+
+            grid_config = config_data.get("grid_strategy", {})
+            bottom = grid_config.get("range", {}).get("bottom", 100)
+            top = grid_config.get("range", {}).get("top", 200)
+            num_grids = grid_config.get("num_grids", 10)
+            spacing_type = grid_config.get("spacing", "arithmetic")
+
+            grid_levels = None
+            if bottom < top and num_grids >= 3:
+                grid_levels = list(VisualizationComponents._grid_levels(bottom, top, num_grids, spacing_type))
+
+            return EnhancedUIComponents.create_interactive_price_chart(
+                {'data': df}, grid_levels=grid_levels, uirevision=chart_uirevision(config_data)
+            )
 
         except Exception as e:
             logger.error(f"Error creating price chart: {e}")
@@ -216,8 +250,9 @@ class VisualizationComponents:
             if not config_data:
                 return dbc.Alert("No configuration data available for backtest preview", color="warning")
 
-            # Generate backtest preview
+            # Generate backtest preview (imported lazily, it pulls in the whole trading bot core)
             try:
+                from web_ui.services.backtest_service import backtest_service
                 preview_data = backtest_service.generate_backtest_preview(config_data)
             except Exception as e:
                 logger.error(f"Error generating backtest preview: {e}")
@@ -252,21 +287,10 @@ class VisualizationComponents:
                     html.H6("Expected Performance Metrics", className="mb-3"),
                     dbc.Row([
                         dbc.Col([
-                            html.H4(f"{performance.get('estimated_roi', 0):.1f}%", className="text-success"),
-                            html.P("Expected ROI", className="text-muted")
-                        ], width=3),
-                        dbc.Col([
-                            html.H4(f"{performance.get('estimated_trades', 0)}", className="text-info"),
-                            html.P("Estimated Trades", className="text-muted")
-                        ], width=3),
-                        dbc.Col([
-                            html.H4(f"{performance.get('max_drawdown', 0):.1f}%", className="text-warning"),
-                            html.P("Max Drawdown", className="text-muted")
-                        ], width=3),
-                        dbc.Col([
-                            html.H4(f"{performance.get('sharpe_ratio', 0):.2f}", className="text-primary"),
-                            html.P("Sharpe Ratio", className="text-muted")
+                            html.H4(value_format.format(performance.get(key, 0)), className=class_name),
+                            html.P(label, className="text-muted")
                         ], width=3)
+                        for key, label, value_format, class_name in BACKTEST_METRICS
                     ], className="mb-4"),
 
                     # Simple recommendations
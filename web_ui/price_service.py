@@ -6,13 +6,201 @@ Provides real-time price data for the web interface.
 
 import asyncio
 import logging
+import threading
+import time
 import ccxt
-from typing import Dict, Optional, Tuple
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
+from utils.constants import TIMEFRAME_MAPPINGS
+from web_ui.utils.downsampling import downsample_ohlcv
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
+# Candle length used when a timeframe is not in TIMEFRAME_MAPPINGS
+DEFAULT_TIMEFRAME_MS = TIMEFRAME_MAPPINGS['1h']
+
+# Candles fetched for the chart tabs (one week of hourly bars)
+MARKET_DATA_CANDLES = 168
+
+
+class _LRUCache(OrderedDict):
+    """Thread-safe dict holding at most maxsize entries, evicting the least recently used one."""
+
+    def __init__(self, maxsize: int = 128):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return self[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def copy(self):
+        clone = _LRUCache(self.maxsize)
+        clone.update(self)
+        return clone
+
+
+class PriceFeed:
+    """Background websocket ticker feed keeping the latest price per symbol in memory."""
+
+    def __init__(self, retry_delay: float = 5.0, max_retry_delay: float = 60.0, max_failures: int = 5,
+                 idle_timeout: float = 300.0, max_subscriptions: int = 20):
+        """
+        Initialize the price feed.
+
+        Args:
+            retry_delay: Delay before the first reconnect, doubled after each further failure
+            max_retry_delay: Upper bound of the reconnect delay
+            max_failures: Consecutive failures after which a symbol is dropped
+            idle_timeout: Seconds without a price read after which a symbol is dropped,
+                also how long a dropped failing symbol is not resubscribed
+            max_subscriptions: Maximum number of symbols streamed at once
+        """
+        self._last_price: Dict[str, float] = {}
+        # Subscribed keys with the monotonic time of their last price read, to drop idle streams
+        self._last_read: Dict[str, float] = {}
+        # Monotonic time until which a key that kept failing is not resubscribed
+        self._retry_after: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ccxtpro = None
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_failures = max_failures
+        self.idle_timeout = idle_timeout
+        self.max_subscriptions = max_subscriptions
+
+    def start(self):
+        """Start the event loop thread hosting the websocket subscriptions."""
+        if self._thread is not None:
+            return
+
+        # Imported lazily, the websocket clients noticeably slow down app start-up
+        try:
+            import ccxt.pro as ccxtpro
+        except ImportError:
+            logger.warning("ccxt.pro is not available, live prices will not be streamed")
+            return
+
+        self._ccxtpro = ccxtpro
+        # A single long-lived loop for all subscriptions, on libuv when uvloop is installed
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="price-feed", daemon=True)
+        self._thread.start()
+
+    def subscribe(self, exchange_name: str, symbol: str) -> bool:
+        """
+        Start streaming tickers for a symbol if it is not streamed yet.
+
+        Symbols are not subscribed while the feed is at max_subscriptions, or while
+        a symbol that was dropped after repeated failures is cooling down.
+
+        Returns:
+            True when a new subscription was started
+        """
+        if self._loop is None:
+            return False
+
+        key = f"{exchange_name}_{symbol}"
+        now = time.monotonic()
+        with self._lock:
+            if key in self._last_read or now < self._retry_after.get(key, 0.0):
+                return False
+            if len(self._last_read) >= self.max_subscriptions:
+                logger.debug(f"Not streaming {symbol} on {exchange_name}, "
+                             f"{self.max_subscriptions} symbols are already streamed")
+                return False
+            self._last_read[key] = now
+
+        asyncio.run_coroutine_threadsafe(self._run_ws_loop(exchange_name, symbol, key), self._loop)
+        return True
+
+    def get_last_price(self, exchange_name: str, symbol: str) -> Optional[float]:
+        """Get the latest streamed price for a symbol, without any I/O."""
+        key = f"{exchange_name}_{symbol}"
+        with self._lock:
+            if key in self._last_read:
+                self._last_read[key] = time.monotonic()
+            return self._last_price.get(key)
+
+    def _is_idle(self, key: str) -> bool:
+        """Whether a subscribed key's price has not been read for idle_timeout seconds."""
+        with self._lock:
+            last_read = self._last_read.get(key, 0.0)
+        return time.monotonic() - last_read >= self.idle_timeout
+
+    def _unsubscribe(self, key: str, retry_after: float = 0.0):
+        """Forget a subscription so its symbol can be subscribed again, after retry_after if set."""
+        with self._lock:
+            self._last_read.pop(key, None)
+            self._last_price.pop(key, None)
+            if retry_after:
+                self._retry_after[key] = retry_after
+
+    async def _run_ws_loop(self, exchange_name: str, symbol: str, key: str):
+        """Watch the ticker stream of a symbol and record each last price until it fails or goes idle."""
+        retry_after = 0.0
+        try:
+            try:
+                exchange = getattr(self._ccxtpro, exchange_name)({'enableRateLimit': True})
+            except AttributeError:
+                logger.error(f"Exchange {exchange_name} does not support websocket streaming")
+                retry_after = time.monotonic() + self.idle_timeout
+                return
+
+            failures = 0
+            try:
+                while not self._is_idle(key):
+                    try:
+                        # Bounded so an idle check still happens when no ticks arrive
+                        ticker = await asyncio.wait_for(exchange.watch_ticker(symbol), self.idle_timeout)
+                        failures = 0
+                        if ticker.get('last') is not None:
+                            with self._lock:
+                                self._last_price[key] = ticker['last']
+                    except asyncio.TimeoutError:
+                        continue
+                    except Exception as e:
+                        failures += 1
+                        if failures >= self.max_failures:
+                            logger.warning(f"Dropping price stream for {symbol} on {exchange_name} "
+                                           f"after {failures} failures: {e}")
+                            retry_after = time.monotonic() + self.idle_timeout
+                            return
+                        delay = min(self.retry_delay * 2 ** (failures - 1), self.max_retry_delay)
+                        logger.warning(f"Price stream error for {symbol} on {exchange_name}, "
+                                       f"retrying in {delay:.0f}s: {e}")
+                        await asyncio.sleep(delay)
+
+                logger.info(f"Stopping idle price stream for {symbol} on {exchange_name}")
+            finally:
+                await exchange.close()
+        finally:
+            self._unsubscribe(key, retry_after)
+
+
 class PriceService:
     """Service for fetching real-time and historical price data."""
     
@@ -21,6 +209,15 @@ class PriceService:
         self.exchanges = {}
         self.price_cache = {}
         self.cache_timeout = 30  # seconds
+        # Bounded per-process caches; a worker that misses a key re-fetches the data
+        self.market_data_cache: Dict[str, pd.DataFrame] = _LRUCache(maxsize=32)
+        self.ohlcv_cache: Dict[Tuple[str, str, str, int], Tuple[int, pd.DataFrame]] = _LRUCache(maxsize=64)
+        self.price_feed = PriceFeed()
+        
+        # One keep-alive HTTP session shared by every REST exchange client, sized for
+        # concurrent callbacks, so repeated requests reuse pooled TCP/TLS connections
+        self.http_session = requests.Session()
+        self.http_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
         
     def get_exchange(self, exchange_name: str):
         """Get or create exchange instance."""
@@ -32,6 +229,7 @@ class PriceService:
                     'sandbox': False,
                     'enableRateLimit': True,
                     'timeout': 10000,  # 10 second timeout
+                    'session': self.http_session,
                 })
             except Exception as e:
                 logger.error(f"Failed to create exchange {exchange_name}: {e}")
@@ -70,6 +268,14 @@ class PriceService:
     def get_current_price_sync(self, exchange_name: str, base_currency: str, quote_currency: str) -> Optional[float]:
         """Synchronous wrapper for get_current_price with timeout protection."""
         try:
+            # Serve the latest streamed tick when the websocket feed has one; a new subscription
+            # falls through to the fallback price right away and later ticks replace it
+            symbol = f"{base_currency}/{quote_currency}"
+            self.price_feed.subscribe(exchange_name, symbol)
+            streamed_price = self.price_feed.get_last_price(exchange_name, symbol)
+            if streamed_price is not None:
+                return streamed_price
+
             # For demo purposes, return mock data to prevent callback failures
             if base_currency == "BTC" and quote_currency in ["USD", "USDT"]:
                 return 95000.0 + (hash(exchange_name) % 1000)  # Mock price with variation
@@ -81,11 +287,34 @@ class PriceService:
             logger.error(f"Error in get_current_price_sync: {e}")
             return None
     
+    @staticmethod
+    def _timeframe_ms(timeframe: str) -> int:
+        """Candle length in milliseconds, falling back to hourly for unknown timeframes."""
+        return TIMEFRAME_MAPPINGS.get(timeframe, DEFAULT_TIMEFRAME_MS)
+
+    @staticmethod
+    def _candle_bucket(timeframe_ms: int) -> int:
+        """Index of the candle currently forming, so cached OHLCV expires when a new bar opens."""
+        return int(time.time() * 1000) // timeframe_ms
+
+    def _get_cached_ohlcv(self, cache_key: Tuple[str, str, str, int], bucket: int) -> Optional[pd.DataFrame]:
+        """Get OHLCV data fetched earlier within the same candle, if any."""
+        cached = self.ohlcv_cache.get(cache_key)
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+        return None
+
     def get_historical_data(self, exchange_name: str, base_currency: str, quote_currency: str,
                           timeframe: str = '1h', limit: int = 100) -> Optional[pd.DataFrame]:
-        """Get historical OHLCV data."""
+        """Get historical OHLCV data, reusing the last fetch until a new candle opens."""
         try:
             symbol = f"{base_currency}/{quote_currency}"
+            cache_key = (exchange_name, symbol, timeframe, limit)
+            bucket = self._candle_bucket(self._timeframe_ms(timeframe))
+            cached_df = self._get_cached_ohlcv(cache_key, bucket)
+            if cached_df is not None:
+                return cached_df
+
             exchange = self.get_exchange(exchange_name)
             if not exchange:
                 logger.error(f"Exchange {exchange_name} not available")
@@ -110,6 +339,7 @@ class PriceService:
             df.set_index('timestamp', inplace=True)
 
             logger.info(f"Successfully fetched {len(df)} data points for {symbol}")
+            self.ohlcv_cache[cache_key] = (bucket, df)
             return df
 
         except Exception as e:
@@ -120,13 +350,19 @@ class PriceService:
                                timeframe: str = '1h', limit: int = 100) -> Optional[pd.DataFrame]:
         """Synchronous wrapper for get_historical_data with timeout protection."""
         try:
+            cache_key = (exchange_name, f"{base_currency}/{quote_currency}", timeframe, limit)
+            timeframe_ms = self._timeframe_ms(timeframe)
+            bucket = self._candle_bucket(timeframe_ms)
+            cached_df = self._get_cached_ohlcv(cache_key, bucket)
+            if cached_df is not None:
+                return cached_df
+
             # For demo purposes, return mock data to prevent callback failures
-            import numpy as np
             from datetime import datetime, timedelta
 
-            # Generate mock historical data
+            # Generate mock historical data spanning `limit` candles of the requested timeframe
             end_time = datetime.now()
-            start_time = end_time - timedelta(hours=limit)
+            start_time = end_time - timedelta(milliseconds=timeframe_ms * limit)
 
             # Create time series
             time_range = pd.date_range(start=start_time, end=end_time, periods=limit)
@@ -145,12 +381,57 @@ class PriceService:
                 'volume': np.random.normal(100, 20, limit)
             }, index=time_range)
 
+            self.ohlcv_cache[cache_key] = (bucket, df)
             return df
 
         except Exception as e:
             logger.error(f"Error in get_historical_data_sync: {e}")
             return None
     
+    @staticmethod
+    def market_data_key(exchange_name: str, base_currency: str, quote_currency: str, timeframe: str) -> str:
+        """Build the key under which a market data frame is cached server-side."""
+        return f"{exchange_name}_{base_currency}/{quote_currency}_{timeframe}"
+
+    def load_market_data(self, exchange_name: str, base_currency: str, quote_currency: str,
+                         timeframe: str) -> Tuple[str, Optional[pd.DataFrame]]:
+        """
+        Fetch chart-sized market data and keep it server-side so only its key goes to the browser.
+
+        Returns:
+            Tuple of (market data key, downsampled frame or None if no data was fetched)
+        """
+        key = self.market_data_key(exchange_name, base_currency, quote_currency, timeframe)
+        df = self.get_historical_data_sync(exchange_name, base_currency, quote_currency, timeframe,
+                                           limit=MARKET_DATA_CANDLES)
+        if df is None or df.empty:
+            return key, None
+
+        # Keep only as many candles as the chart can display
+        df = downsample_ohlcv(df)
+        self.market_data_cache[key] = df
+        return key, df
+
+    def get_market_data(self, market_data: Optional[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """
+        Get the frame a market-data-store payload points to.
+
+        The cache is per process, so a worker that did not serve the fetch
+        loads the data again from the exchange, timeframe and pair in the payload.
+        """
+        key = market_data.get('key') if market_data else None
+        if not key:
+            return None
+
+        df = self.market_data_cache.get(key)
+        if df is None:
+            try:
+                _, df = self.load_market_data(market_data['exchange'], market_data['base_currency'],
+                                              market_data['quote_currency'], market_data['timeframe'])
+            except KeyError:
+                return None
+        return df
+
     def get_price_range_suggestion(self, current_price: float, volatility_factor: float = 0.15) -> Tuple[float, float]:
         """Suggest price range for grid based on current price and volatility."""
         if not current_price:
@@ -172,11 +453,10 @@ class PriceService:
         """Calculate grid metrics and statistics."""
         try:
             if spacing_type == 'arithmetic':
-                grid_levels = [bottom + i * (top - bottom) / (num_grids - 1) for i in range(num_grids)]
+                grid_levels = np.linspace(bottom, top, num_grids).tolist()
                 avg_spacing = (top - bottom) / (num_grids - 1)
             else:  # geometric
-                ratio = (top / bottom) ** (1 / (num_grids - 1))
-                grid_levels = [bottom * (ratio ** i) for i in range(num_grids)]
+                grid_levels = np.geomspace(bottom, top, num_grids).tolist()
                 avg_spacing = "Variable"
             
             # Calculate metrics
@@ -234,6 +514,7 @@ class PriceService:
             except Exception as e:
                 logger.error(f"Error closing exchange: {e}")
         self.exchanges.clear()
+        self.http_session.close()
 
 # Global price service instance
 price_service = PriceService()
@@ -10,13 +10,15 @@ import logging
 import os
 import sys
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Union
 from pathlib import Path
 import base64
 
 # Add the project root to the path to import from config
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from utils.file_utils import atomic_write_json
+
 try:
     from config.unified_config_service import unified_config_service
 except ImportError:
@@ -75,8 +77,9 @@ class UIConfigManager:
     def _legacy_save_config(self, config: Dict[str, Any], filename: Optional[str] = None) -> Tuple[bool, str]:
         """Legacy save configuration method for fallback."""
         try:
+            now = datetime.now()
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"grid_config_{timestamp}.json"
 
             # Ensure .json extension
@@ -88,16 +91,15 @@ class UIConfigManager:
             # Add metadata
             config_with_metadata = {
                 "metadata": {
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": now.isoformat(),
                     "created_by": "Grid Trading Bot Web UI",
                     "version": "1.0",
-                    "description": f"Grid trading configuration saved on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                    "description": f"Grid trading configuration saved on {now.strftime('%Y-%m-%d %H:%M:%S')}"
                 },
                 "config": config
             }
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(config_with_metadata, f, indent=2, ensure_ascii=False)
+            atomic_write_json(config_with_metadata, filepath)
 
             logger.info(f"Configuration saved to {filepath}")
             return True, str(filepath)
@@ -176,8 +178,9 @@ class UIConfigManager:
     def _legacy_export_config(self, config: Dict[str, Any], filename: str = None) -> Tuple[bool, str, str]:
         """Legacy export configuration method for fallback."""
         try:
+            now = datetime.now()
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"grid_config_{timestamp}.json"
 
             # Ensure .json extension
@@ -187,10 +190,10 @@ class UIConfigManager:
             # Add metadata
             config_with_metadata = {
                 "metadata": {
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": now.isoformat(),
                     "created_by": "Grid Trading Bot Web UI",
                     "version": "1.0",
-                    "description": f"Grid trading configuration exported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    "description": f"Grid trading configuration exported on {now.strftime('%Y-%m-%d %H:%M:%S')}",
                     "export_type": "browser_download"
                 },
                 "config": config
@@ -210,12 +213,12 @@ class UIConfigManager:
             logger.error(error_msg)
             return False, "", error_msg
     
-    def import_config_from_upload(self, file_content: str) -> Tuple[bool, Dict[str, Any], str]:
+    def import_config_from_upload(self, file_content: Union[str, bytes]) -> Tuple[bool, Dict[str, Any], str]:
         """
         Import configuration from uploaded file content.
 
         Args:
-            file_content: JSON string content of uploaded file
+            file_content: JSON content of uploaded file, as text or raw UTF-8 bytes
 
         Returns:
             Tuple of (success, config_dict, message)
@@ -227,7 +230,7 @@ class UIConfigManager:
             # Fall back to legacy implementation
             return self._legacy_import_config(file_content)
 
-    def _legacy_import_config(self, file_content: str) -> Tuple[bool, Dict[str, Any], str]:
+    def _legacy_import_config(self, file_content: Union[str, bytes]) -> Tuple[bool, Dict[str, Any], str]:
         """Legacy import configuration method for fallback."""
         try:
             data = json.loads(file_content)
@@ -0,0 +1,40 @@
+"""
+Downsampling Utilities for Grid Trading Bot Web UI
+
+Reduces OHLCV series to roughly the number of points a chart can display
+before they are stored in the browser.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Upper bound on candles shipped to the browser, roughly the chart pixel width
+MAX_CHART_POINTS = 2000
+
+
+def downsample_ohlcv(df: pd.DataFrame, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """
+    Aggregate consecutive candles into at most ``max_points`` buckets.
+
+    Each bucket keeps the first open, highest high, lowest low, last close and
+    summed volume of its candles, i.e. the M4 first/max/min/last points, so the
+    visible price envelope is preserved.
+
+    Args:
+        df: OHLCV DataFrame indexed by timestamp
+        max_points: Maximum number of candles to keep
+    """
+    num_rows = len(df)
+    if num_rows <= max_points:
+        return df
+
+    starts = np.linspace(0, num_rows, max_points, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], num_rows) - 1
+
+    return pd.DataFrame({
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(), starts),
+        'close': df['close'].to_numpy()[ends],
+        'volume': np.add.reduceat(df['volume'].to_numpy(), starts)
+    }, index=df.index[starts])
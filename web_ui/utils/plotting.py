@@ -0,0 +1,122 @@
+"""
+Plotting Utilities for Grid Trading Bot Web UI
+
+Helpers for building Plotly traces shared by the grid charts.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+
+def chart_uirevision(config: Optional[Dict[str, Any]]) -> str:
+    """
+    Build the uirevision key of a chart from the configured exchange, pair and timeframe.
+
+    Plotly keeps the user's zoom and pan across figure updates while the key is unchanged,
+    so live price and grid updates preserve the view until the market itself changes.
+    """
+    config = config or {}
+    exchange = config.get("exchange", {}).get("name", "")
+    pair = config.get("pair", {})
+    timeframe = config.get("trading_settings", {}).get("timeframe", "")
+    return f"{exchange}:{pair.get('base_currency', '')}/{pair.get('quote_currency', '')}:{timeframe}"
+
+
+def grid_line_trace(levels: Sequence[float], color: str, name: str,
+                    x_range: Tuple[float, float] = (0.0, 1.0), width: int = 1,
+                    dash: str = "dash") -> go.Scattergl:
+    """
+    Draw horizontal lines at ``levels`` as a single NaN-separated WebGL trace.
+
+    One trace replaces a layout shape per level, which keeps the figure JSON
+    and the browser's relayout cost flat as the number of grids grows.
+
+    Args:
+        levels: Prices to draw a line at
+        color: Line color
+        name: Trace name shown in the hover label
+        x_range: Start and end of each segment in x-axis data coordinates
+        width: Line width
+        dash: Line dash style
+    """
+    num_levels = len(levels)
+    x = np.tile([x_range[0], x_range[1], np.nan], num_levels)
+    y = np.repeat(np.asarray(levels, dtype=float), 3)
+    y[2::3] = np.nan
+
+    return go.Scattergl(
+        x=x, y=y,
+        mode="lines",
+        name=name,
+        line=dict(color=color, width=width, dash=dash),
+        hovertemplate="$%{y:,.2f}<extra>" + name + "</extra>"
+    )
+
+
+def format_price_labels(levels: Sequence[float], template: str = "${:,.2f}") -> List[str]:
+    """Format every grid level once, on plain Python floats rather than numpy scalars."""
+    return [template.format(level) for level in np.asarray(levels, dtype=float).tolist()]
+
+
+def grid_label_trace(levels: Sequence[float], labels: Sequence[str], colors: Sequence[str],
+                     x: float = 1.0) -> go.Scatter:
+    """
+    Draw grid level labels as a single text trace instead of one layout annotation per level.
+
+    Args:
+        levels: Prices the labels sit at
+        labels: Text of each label
+        colors: Text color of each label
+        x: Position of the labels in x-axis data coordinates, typically the right edge
+    """
+    return go.Scatter(
+        x=np.full(len(labels), x),
+        y=levels,
+        text=labels,
+        mode="text",
+        textposition="middle right",
+        textfont=dict(color=colors, size=10),
+        hoverinfo="skip",
+        cliponaxis=False
+    )
+
+
+def ohlc_traces(df: pd.DataFrame, increasing_color: str = "#10b981",
+                decreasing_color: str = "#ef4444") -> List[go.Scattergl]:
+    """
+    Draw OHLC bars as two WebGL line traces, one for rising and one for falling bars.
+
+    Each bar is a vertical high/low segment with a left open tick and a right
+    close tick, all NaN-separated, so the browser issues a single draw call per
+    direction instead of laying out an SVG element per candle.
+
+    Args:
+        df: OHLCV DataFrame indexed by timestamp
+        increasing_color: Color of bars closing at or above their open
+        decreasing_color: Color of bars closing below their open
+    """
+    # Epoch milliseconds on a date axis, so NaN can separate the segments
+    x = df.index.as_unit('ms').asi8.astype(float)
+    tick = 0.3 * float(np.median(np.diff(x))) if len(x) > 1 else 0.0
+    opens, highs = df['open'].to_numpy(dtype=float), df['high'].to_numpy(dtype=float)
+    lows, closes = df['low'].to_numpy(dtype=float), df['close'].to_numpy(dtype=float)
+    gap = np.full(len(x), np.nan)
+
+    # Nine points per bar: low->high, open tick, close tick, each followed by a gap
+    seg_x = np.column_stack([x, x, gap, x - tick, x, gap, x, x + tick, gap])
+    seg_y = np.column_stack([lows, highs, gap, opens, opens, gap, closes, closes, gap])
+
+    rising = closes >= opens
+    return [
+        go.Scattergl(
+            x=seg_x[mask].ravel(), y=seg_y[mask].ravel(),
+            mode="lines",
+            name=name,
+            line=dict(color=color, width=1),
+            hoverinfo="skip"
+        )
+        for mask, color, name in ((rising, increasing_color, "Rising"), (~rising, decreasing_color, "Falling"))
+    ]
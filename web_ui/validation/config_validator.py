@@ -5,6 +5,7 @@ Provides comprehensive validation for all configuration parameters.
 """
 
 import logging
+import threading
 from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import re
@@ -37,8 +38,26 @@ class UIConfigValidator:
     
     def __init__(self):
         """Initialize the validator."""
-        self.errors = []
-        self.warnings = []
+        # Results are kept per thread so one shared validator can serve concurrent callbacks
+        self._results = threading.local()
+    
+    @property
+    def errors(self) -> List[str]:
+        """Errors collected by the current thread's last validate_config call."""
+        return self._results.__dict__.setdefault("errors", [])
+    
+    @errors.setter
+    def errors(self, value: List[str]):
+        self._results.errors = value
+    
+    @property
+    def warnings(self) -> List[str]:
+        """Warnings collected by the current thread's last validate_config call."""
+        return self._results.__dict__.setdefault("warnings", [])
+    
+    @warnings.setter
+    def warnings(self, value: List[str]):
+        self._results.warnings = value
     
     def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
         """
@@ -295,3 +314,7 @@ class UIConfigValidator:
             
         except Exception as e:
             return False, f"Validation error: {str(e)}"
+
+
+# Global validator instance shared by the callbacks
+ui_config_validator = UIConfigValidator()